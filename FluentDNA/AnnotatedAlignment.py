@@ -10,13 +10,15 @@ of four "tracks" together.  This allows you to compare two annotations in the
 context of their respective sequences.
 """
 import os
+from collections import OrderedDict
 from DNASkittleUtils.DDVUtils import editable_str
 
 from FluentDNA.ChainParser import ChainParser, scan_past_header, Batch
 from DNASkittleUtils.Contigs import pluck_contig
-from DNASkittleUtils.DDVUtils import first_word, ReverseComplement
+from DNASkittleUtils.DDVUtils import first_word
 
 from FluentDNA.Annotations import create_fasta_from_annotation, GFF
+from FluentDNA.FastaIndex import ReverseComplementView
 
 
 class AnnotatedAlignment(ChainParser):
@@ -56,7 +58,7 @@ class AnnotatedAlignment(ChainParser):
 
 
     def rev_comp_contig(self, query_name):
-        return ReverseComplement(self.query_contigs[query_name], annotation=self.annotation_phase)
+        return ReverseComplementView(self.query_contigs[query_name], annotation=self.annotation_phase)
 
 
     def _parse_chromosome_in_chain(self, chromosome_name):# -> Batch:
@@ -72,7 +74,7 @@ class AnnotatedAlignment(ChainParser):
         self.query_seq_gapped = editable_str('')
         self.ref_seq_gapped = editable_str('')
         self.query_contigs = {}
-        self.stored_rev_comps = {}
+        self.stored_rev_comps = OrderedDict()
         self.annotation_phase = True
         # At this point we have created two gapped sequence fastas
 
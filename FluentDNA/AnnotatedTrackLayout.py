@@ -1,10 +1,10 @@
 import math
-from DNASkittleUtils.Contigs import read_contigs
 from itertools import chain
 from os.path import join, basename
 
 from FluentDNA.Annotations import create_fasta_from_annotation, find_universal_prefix, parseGFF
 from FluentDNA.ParallelGenomeLayout import ParallelLayout
+from FluentDNA.FastaIndex import read_indexed_contigs
 from FluentDNA.FluentDNAUtils import filter_by_contigs, copy_to_sources
 
 
@@ -21,8 +21,7 @@ class AnnotatedTrackLayout(ParallelLayout):
     def render_genome(self, output_folder, output_file_name, extract_contigs=None):
         self.annotation_fasta = join(output_folder, 'sources', basename(self.gff_filename) +
                                      ('.fa' if extract_contigs is None else '_extracted.fa'))
-        self.contigs = read_contigs(self.fasta_file)
-        # TODO: Genome is read_contigs twice unnecessarily. This could be sped up.
+        self.contigs = read_indexed_contigs(self.fasta_file)  # only names and lengths are needed here
         self.contigs = filter_by_contigs(self.contigs, extract_contigs)
         extract_contigs = [x.name.split()[0] for x in self.contigs]
         lengths = [len(x.seq) for x in self.contigs]
@@ -84,9 +83,8 @@ class AnnotatedTrackLayout(ParallelLayout):
             scaff_name = scaffold["name"].split()[0]
             if scaff_name not in labels.keys():
                 continue
-            for entry in labels[scaff_name]:
-                if entry.type in ['gene', 'mRNA'] and \
-                        (not entry.parent() or entry.parent() not in genes_seen): #mRNA double of a gene
+            for entry in labels[scaff_name].of_type(['gene', 'mRNA']):
+                if not entry.parent() or entry.parent() not in genes_seen: #mRNA double of a gene
                     genes_seen.add(entry.id())
                     name = entry.name(universal_prefix)
                     progress = (entry.start ) // genome_width *\
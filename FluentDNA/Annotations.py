@@ -2,19 +2,45 @@ from __future__ import print_function, division, absolute_import, \
     with_statement, generators, nested_scopes
 
 import os
+from array import array
 from collections import namedtuple, defaultdict
-from itertools import chain
 import gzip
-from DNASkittleUtils.Contigs import Contig, read_contigs, write_contigs_to_file
 
-from DNASkittleUtils.DDVUtils import editable_str
+import numpy as np
+from DNASkittleUtils.Contigs import Contig, write_contigs_to_file
+
 from FluentDNA import gap_char
+from FluentDNA.FastaIndex import read_indexed_contigs
 
 try:
     from urllib.parse import unquote
 except ImportError:
     from urllib2.parse import unquote  # for python 2.7
 
+def open_annotation(annotation_file):
+    """Text mode for both plain and gzipped files"""
+    if annotation_file.endswith(".gz"):
+        return gzip.open(annotation_file, 'rt')
+    return open(annotation_file)
+
+
+def parse_loose_attributes(attribute_column):
+    """key=value;key=value with quotes removed, or GTF style key "value"; pairs"""
+    attributes = {}
+    pairs = [pair.strip() for pair in attribute_column.split(';') if pair]
+    try:
+        attributes = {pair.split('=')[0]: pair.split('=')[1].replace('"', '') for pair in pairs}
+    except IndexError:  #GTF separates by spaces and uses quotes
+        try:
+            for pair in pairs:
+                if ' ' in pair:  #only split by the first space
+                    k, v = pair[:pair.find(' ')], pair[pair.find(' ')+1:]
+                    attributes[k] = v.replace('"', '')
+        except IndexError:
+            print('Annotation attributes were not in the expected format: use key1=value1;key2=value2;')
+    return attributes
+
+
 class GFF(object):
     def __init__(self, annotation_file):
         self.specimen, self.gff_version, \
@@ -32,8 +58,7 @@ class GFF(object):
         file_name = os.path.splitext(os.path.basename(annotation_file))[0]
         annotations = {}
 
-        openFunc = gzip.open if annotation_file.endswith(".gz") else open
-        with openFunc(annotation_file) as open_annotation_file:
+        with open_annotation(annotation_file) as open_annotation_file:
             counter = 0
             print("Opening Annotation file:", annotation_file)
             for line in open_annotation_file.readlines():
@@ -86,17 +111,7 @@ class GFF(object):
 
                         attributes = {}
                         if len(elements) >= 9:
-                            pairs = [pair.strip() for pair in elements[8].split(';') if pair]
-                            try:
-                                attributes = {pair.split('=')[0]: pair.split('=')[1].replace('"', '') for pair in pairs}
-                            except IndexError:  #GTF separates by spaces and uses quotes
-                                try:
-                                    for pair in pairs:
-                                        if ' ' in pair:  #only split by the first space
-                                            k, v = pair[:pair.find(' ')], pair[pair.find(' ')+1:]
-                                            attributes[k] = v.replace('"', '')
-                                except IndexError:
-                                    print('Annotation attributes were not in the expected format: use key1=value1;key2=value2;')
+                            attributes = parse_loose_attributes(elements[8])
 
 
                         if type != 'chromosome':  # chromosomes don't have strand or phase
@@ -198,8 +213,7 @@ def parseGFF3(filename):
     Supports transparent gzip decompression.
     """
     # Parse with transparent decompression
-    openFunc = gzip.open if filename.endswith(".gz") else open
-    with openFunc(filename) as infile:
+    with open_annotation(filename) as infile:
         for line in infile:
             if line.startswith("#"): continue
             parts = line.strip().split("\t")
@@ -222,52 +236,378 @@ def parseGFF3(filename):
             yield GFF3Record(**normalizedInfo)
 
 
+class AnnotationTable(object):
+    """Every record of an annotation file stored column by column: numpy arrays for the numbers,
+    small vocabularies for the repetitive text columns and one utf-8 blob of the original lines.
+    gff3 is True if the whole file follows GFF3 strictly, which decides how records are read back,
+    the same way parseGFF() used to fall back to the GFF class for anything else."""
+    cache_version = 2
+    text_columns = ('seqid', 'source', 'type', 'strand', 'phase')
+
+    def __init__(self, columns, vocabularies, gff3):
+        self.columns = columns  # name: numpy array, one element per record
+        self.vocabularies = vocabularies  # text column name: list of distinct raw values
+        self.gff3 = gff3
+        if gff3:  # GFF3 escapes its text columns
+            self.values = {name: [None if x == '.' else unquote(x) for x in vocabularies[name]]
+                           for name in self.text_columns}
+            self.values['seqid'] = [None if x.lstrip() == '.' else unquote(x.lstrip())  # parseGFF3() stripped lines
+                                    for x in vocabularies['seqid']]
+        else:
+            self.values = {name: list(vocabularies[name]) for name in self.text_columns}
+            self.values['strand'] = [None if x == '.' else x for x in vocabularies['strand']]
+            self.values['phase'] = [None if x == '.' else int(x) for x in vocabularies['phase']]
+
+    def text(self, name, row):
+        return self.values[name][self.columns[name][row]]
+
+    def line_text(self, row, begin=None):
+        """The line exactly as it was in the file, or only from byte begin on"""
+        offsets = self.columns['line_offsets']
+        begin = offsets[row] if begin is None else begin
+        return self.columns['lines'][begin: offsets[row + 1]].tobytes().decode('utf-8')
+
+    def attribute_text(self, row):
+        """Everything after the 8th tab, empty if there isn't a 9th column"""
+        return self.line_text(row, self.columns['attribute_starts'][row])
+
+    def record(self, row):
+        """The GFF3Record or GFFAnnotation that used to be made for this line, attributes included"""
+        c = self.columns
+        start, end, score = int(c['start'][row]), int(c['end'][row]), float(c['score'][row])
+        start, end = None if start < 0 else start, None if end < 0 else end
+        score = None if score != score else score  # NaN means '.'
+        seqid, source, kind, strand, phase = (self.text(name, row) for name in self.text_columns)
+        text = self.attribute_text(row)
+        if self.gff3:
+            return GFF3Record(seqid, source, kind, start, end, score, strand, phase,
+                              parseGFFAttributes(text.strip()))
+        return GFFAnnotation(seqid, int(c['counter'][row]), source, kind, start, end, score, strand, phase,
+                             parse_loose_attributes(text.split('\t')[0]), self.line_text(row))
+
+    def by_sequence(self):
+        """{seqid: AnnotationColumns} in order of first appearance, like parseGFF() always returned"""
+        codes = self.columns['seqid']
+        rows = np.arange(len(codes))
+        if not self.gff3:  # chromosomes don't have strand or phase
+            kinds = self.vocabularies['type']
+            if 'chromosome' in kinds:
+                rows = rows[self.columns['type'] != kinds.index('chromosome')]
+        rows = rows[np.argsort(codes[rows], kind='mergesort')]  # stable, so file order within a sequence
+        boundaries = np.searchsorted(codes[rows], np.arange(len(self.vocabularies['seqid']) + 1))
+        annotations = {}
+        for code, name in enumerate(self.values['seqid']):
+            found = rows[boundaries[code]: boundaries[code + 1]]
+            if not len(found):
+                continue
+            if name in annotations:  # two spellings of the same escaped name
+                found = np.sort(np.concatenate([annotations[name].rows, found]))
+            annotations[name] = AnnotationColumns(self, name, found)
+        return annotations
+
+
+class AnnotationColumns(object):
+    """The annotations on one sequence.  Behaves like the list of GFFAnnotation objects parseGFF()
+    used to return, but records are only made (and their attributes parsed) when they're used.
+    starts, ends and types give whole columns without making any records.
+    Region queries return another AnnotationColumns, still in file order."""
+    def __init__(self, table, seqid, rows):
+        self.table = table
+        self.seqid = seqid
+        self.rows = rows
+        self.sorted_index = None  # made by interval_index() on first use
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        for row in self.rows.tolist():
+            yield self.table.record(row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.table.record(row) for row in self.rows[index].tolist()]
+        return self.table.record(int(self.rows[index]))
+
+    @property
+    def starts(self):
+        return self.table.columns['start'][self.rows]
+
+    @property
+    def ends(self):
+        return self.table.columns['end'][self.rows]
+
+    @property
+    def types(self):
+        """Feature type of each record as an array of strings"""
+        values = np.array(self.table.values['type'] + [None], dtype=object)[:-1]
+        return values[self.table.columns['type'][self.rows]]
+
+    @property
+    def extent(self):
+        """Largest coordinate of any record, 0 if there are none"""
+        rows, starts, ends, reach = self.interval_index()
+        return int(max(reach[-1], starts[-1])) if len(rows) else 0
+
+    def subset(self, rows):
+        return AnnotationColumns(self.table, self.seqid, np.sort(rows))
+
+    def interval_index(self):
+        """Rows sorted by start, with their starts, ends and the running maximum of the ends.
+        Everything that can overlap a region is between the first running maximum that reaches
+        the region and the last start inside it."""
+        if self.sorted_index is None:
+            order = np.argsort(self.starts, kind='mergesort')
+            ends = self.ends[order]
+            reach = np.maximum.accumulate(ends) if len(ends) else ends
+            self.sorted_index = (self.rows[order], self.starts[order], ends, reach)
+        return self.sorted_index
+
+    def of_type(self, types):
+        """Records whose type is one of types"""
+        codes = [code for code, name in enumerate(self.table.values['type']) if name in types]
+        return AnnotationColumns(self.table, self.seqid,
+                                 self.rows[np.isin(self.table.columns['type'][self.rows], codes)])
+
+    def overlapping(self, start, end):
+        """Records sharing at least one position with start..end, inclusive like GFF"""
+        rows, starts, ends, reach = self.interval_index()
+        first = np.searchsorted(reach, start, 'left')
+        candidates = np.arange(first, max(first, np.searchsorted(starts, end, 'right')))
+        return self.subset(rows[candidates[ends[candidates] >= start]])
+
+    def contained(self, start, end):
+        """Records that lie entirely within start..end"""
+        rows, starts, ends, reach = self.interval_index()
+        first = np.searchsorted(starts, start, 'left')
+        candidates = np.arange(first, max(first, np.searchsorted(starts, end, 'right')))
+        return self.subset(rows[candidates[ends[candidates] <= end]])
+
+    def nearest(self, position):
+        """The record closest to position, or None if there aren't any.  A record covering position
+        is distance 0 and ties go to the one on the left.  annotations.of_type(['gene']).nearest(x)
+        finds the nearest gene."""
+        rows, starts, ends, reach = self.interval_index()
+        if not len(rows):
+            return None
+        before = np.searchsorted(starts, position, 'right')  # records starting at or before position
+        best, distance = None, None
+        if before:
+            best = np.flatnonzero(ends[:before] == reach[before - 1])[0]  # the one reaching furthest right
+            distance = max(0, position - int(reach[before - 1]))
+        if before < len(rows) and (best is None or int(starts[before]) - position < distance):
+            best = before
+        return self.table.record(int(rows[best]))
+
+
+def strict_gff3_attributes(attribute_column):
+    """True if parseGFFAttributes() would accept it"""
+    return attribute_column == '.' or all(len(x.split('=')) == 2 for x in attribute_column.split(';'))
+
+
+def scan_annotation_file(annotation_file):
+    """One pass over a GFF3, GTF or older GFF file, keeping each column in a compact array."""
+    assert os.path.isfile(annotation_file), "File does not exist:" + annotation_file
+    print("Opening Annotation file:", annotation_file)
+    numbers = {'start': array('q'), 'end': array('q'), 'score': array('d'), 'counter': array('q')}
+    codes = {name: array('l') for name in AnnotationTable.text_columns}
+    vocabularies = {name: {} for name in AnnotationTable.text_columns}
+    raw_lines, line_offsets, attribute_starts = bytearray(), array('q', [0]), array('q')
+    gff3 = True
+    counter = 0
+    with open_annotation(annotation_file) as lines:
+        for line in lines:
+            if line.startswith("#"):
+                continue
+            stripped = line.strip()
+            if not stripped:
+                gff3 = False  # parseGFF3() doesn't allow blank lines
+                continue
+            counter += 1
+            elements = line.split('\t', 8)
+            if len(elements) < 8:
+                gff3 = False
+                print("Skipping annotation line with too few columns:", line)
+                continue
+            if gff3:
+                parts = stripped.split('\t')
+                gff3 = len(parts) == 9 and strict_gff3_attributes(parts[8])
+            try:
+                start = -1 if elements[3] == '.' else int(elements[3])
+                end = -1 if elements[4] == '.' else int(elements[4])
+                score = float('nan') if elements[5] == '.' else float(elements[5])
+            except ValueError:
+                gff3 = False
+                print("Skipping annotation line with bad numbers:", line)
+                continue
+            numbers['start'].append(start)
+            numbers['end'].append(end)
+            numbers['score'].append(score)
+            numbers['counter'].append(counter)
+            for name, value in zip(AnnotationTable.text_columns, (elements[0], elements[1], elements[2],
+                                                                  elements[6], elements[7])):
+                vocabulary = vocabularies[name]
+                if value not in vocabulary:
+                    vocabulary[value] = len(vocabulary)
+                codes[name].append(vocabulary[value])
+            raw_lines.extend(line.encode('utf-8'))
+            line_offsets.append(len(raw_lines))
+            attribute_starts.append(len(raw_lines) - (len(elements[8].encode('utf-8')) if len(elements) > 8 else 0))
+    if not gff3 and any(phase != '.' and not phase.strip().lstrip('-').isdigit()
+                        for phase in vocabularies['phase']):
+        raise ValueError("Phase must be a number or '.' in " + annotation_file)
+    columns = {name: np.frombuffer(values, dtype=np.int64 if values.typecode == 'q' else np.float64)
+               if len(values) else np.zeros(0, dtype=np.int64 if values.typecode == 'q' else np.float64)
+               for name, values in numbers.items()}
+    columns.update({name: np.array(values, dtype=np.int32) for name, values in codes.items()})
+    columns['lines'] = np.frombuffer(bytes(raw_lines), dtype=np.uint8)
+    columns['line_offsets'] = np.frombuffer(line_offsets, dtype=np.int64)
+    columns['attribute_starts'] = np.array(attribute_starts, dtype=np.int64)
+    vocabularies = {name: sorted(vocabulary, key=vocabulary.get) for name, vocabulary in vocabularies.items()}
+    print("Read %i annotations on %i sequences as %s" % (len(columns['start']), len(vocabularies['seqid']),
+                                                         'GFF3' if gff3 else 'GTF/GFF'))
+    return AnnotationTable(columns, vocabularies, gff3)
+
+
+min_cached_bytes = 1024 * 1024  # smaller annotations are read again faster than a cache is worth
+
+
+def annotation_cache_path(annotation_file):
+    return annotation_file + '.cache.npz'
+
+
+def load_annotation_cache(annotation_file):
+    """AnnotationTable from the cache next to the annotation, or None if it's missing or out of date"""
+    cache = annotation_cache_path(annotation_file)
+    if not os.path.exists(cache) or os.path.getmtime(cache) < os.path.getmtime(annotation_file):
+        return None
+    try:
+        with np.load(cache) as saved:
+            if int(saved['cache_version']) != AnnotationTable.cache_version or \
+                    int(saved['source_size']) != os.path.getsize(annotation_file):
+                return None
+            columns = {name[len('column_'):]: saved[name] for name in saved.files if name.startswith('column_')}
+            vocabularies = {name: saved['vocabulary_' + name].tolist() for name in AnnotationTable.text_columns}
+            return AnnotationTable(columns, vocabularies, bool(saved['gff3']))
+    except (IOError, OSError, ValueError, KeyError) as e:
+        print("Ignoring unreadable annotation cache", cache, e)
+        return None
+
+
+def save_annotation_cache(annotation_file, table):
+    """Silently skips folders that aren't writeable"""
+    arrays = {'column_' + name: values for name, values in table.columns.items()}
+    arrays.update({'vocabulary_' + name: np.array(values, dtype=str)
+                   for name, values in table.vocabularies.items()})
+    try:
+        with open(annotation_cache_path(annotation_file), 'wb') as cache:
+            np.savez(cache, cache_version=table.cache_version, gff3=table.gff3,
+                     source_size=os.path.getsize(annotation_file), **arrays)
+    except (IOError, OSError):
+        pass
+
+
+def read_annotation_table(annotation_file):
+    table = load_annotation_cache(annotation_file)
+    if table is None:
+        table = scan_annotation_file(annotation_file)
+        if os.path.getsize(annotation_file) >= min_cached_bytes:
+            save_annotation_cache(annotation_file, table)
+    return table
+
+
 def parseGFF(gff_file):
+    """{seqid: AnnotationColumns} for a GFF3, GTF or older GFF file, gzipped or not.
+    GFF3 files give GFF3Records, anything else gives GFFAnnotations."""
     if gff_file is None:
         return None
-    annotations = defaultdict(lambda : [])
-    #Version 3
-    try:
-        parser = parseGFF3(gff_file)
-        for entry in parser:
-            annotations[entry.seqid].append(entry)
-    except (AssertionError, ValueError):
-        # Version 2
-        parsed = GFF(gff_file)
-        annotations = parsed.annotations
-    return annotations
+    return read_annotation_table(gff_file).by_sequence()
 
 
-def handle_tail(seq_array, scaffold_lengths, sc_index):
-    if scaffold_lengths is not None:
-        remaining = scaffold_lengths[sc_index] - len(seq_array)
-        seq_array.extend( gap_char * remaining)
+def squish_columns(annotation_width, base_width):
+    """Which of each base_width bases are kept: every skip_size'th, the last skip also covers the remainder"""
+    skip_size = base_width // annotation_width
+    return np.arange(annotation_width, dtype=np.int64) * skip_size
+
+
+def squish_codes(codes, annotation_width, base_width):
+    """Samples annotation_width of every base_width characters of a uint8 array.  Whole lines are
+    a reshape and one gather, the partial last line keeps the columns that fit."""
+    columns = squish_columns(annotation_width, base_width)
+    full_lines = len(codes) // base_width
+    lines = codes[:full_lines * base_width].reshape(full_lines, base_width)
+    tail = codes[full_lines * base_width:]
+    return np.concatenate([lines[:, columns].ravel(), tail[columns[columns < len(tail)]]])
 
 
 def squish_fasta(scaffolds, annotation_width, base_width):
     print("Squishing annotation by %i / %i" % (base_width, annotation_width))
     squished_versions = []
-    skip_size = base_width // annotation_width
-    remainder = base_width - (skip_size * annotation_width)
-    skips = list(chain([skip_size] * (annotation_width - 1), [skip_size + remainder]))
     for contig in scaffolds:
-        work = editable_str('')
-        i = 0; x = 0
-        while i < len(contig.seq):
-            work.append(contig.seq[i])
-            i += skips[x % annotation_width]
-            x += 1
-        squished_versions.append(Contig(contig.name, ''.join(work)))
+        codes = np.frombuffer(str(contig.seq).encode('latin-1'), dtype=np.uint8)
+        squished = squish_codes(codes, annotation_width, base_width)
+        squished_versions.append(Contig(contig.name, squished.tobytes().decode('latin-1')))
     return squished_versions
 
 
+def squish_fasta_file(fasta_path, output_path, annotation_width, base_width, lines_per_read=100000):
+    """squish_fasta() from one file to another, reading an indexed FASTA a block of lines at a time
+    so the full sized sequences are never in memory."""
+    print("Squishing annotation by %i / %i" % (base_width, annotation_width))
+    block = base_width * lines_per_read
+    with open(output_path, 'w') as out:
+        for contig in read_indexed_contigs(fasta_path):
+            out.write('>' + contig.name + '\n')
+            pending = ''
+            for start in range(0, len(contig.seq), block):
+                codes = np.frombuffer(str(contig.seq[start: start + block]).encode('latin-1'), dtype=np.uint8)
+                pending += squish_codes(codes, annotation_width, base_width).tobytes().decode('latin-1')
+                full = len(pending) - len(pending) % 70  # same 70 character lines as write_contigs_to_file()
+                out.write(''.join(pending[i: i + 70] + '\n' for i in range(0, full, 70)))
+                pending = pending[full:]
+            if pending:
+                out.write(pending + '\n')
+    print("Done writing", output_path)
+
+
 def gather_chromosome_lengths(gff):
     chromosome_lengths = {}
     for chrom in gff:
-        chromosome_lengths[chrom] = max([max(entry.end, entry.start) for entry in gff[chrom]])
+        if isinstance(gff[chrom], AnnotationColumns):  # no need to make records
+            chromosome_lengths[chrom] = gff[chrom].extent
+        else:
+            chromosome_lengths[chrom] = max([max(entry.end, entry.start) for entry in gff[chrom]])
     return chromosome_lengths
 
 
+def feature_columns(entries):
+    """starts, ends and types arrays for an AnnotationColumns or a list of GFFAnnotations"""
+    if isinstance(entries, AnnotationColumns):
+        return entries.starts, entries.ends, entries.types
+    return (np.array([entry.start for entry in entries], dtype=np.int64),
+            np.array([entry.end for entry in entries], dtype=np.int64),
+            np.array([entry.type for entry in entries] + [None], dtype=object)[:-1])
+
+
+def paint_features(length, starts, ends, types, features, background_priority):
+    """uint8 array of the symbol of the most important feature covering each position.  Features are
+    painted from least to most important, and within a priority from the end of the file to the start,
+    so the first of equally important features stays on top.  Only features more important than
+    background_priority are painted."""
+    painted = np.full(length, ord(gap_char), dtype=np.uint8)
+    priorities = np.full(len(types), np.inf)
+    symbols = np.zeros(len(types), dtype=np.uint8)
+    for name, feature in features.items():
+        chosen = types == name
+        priorities[chosen] = feature.priority
+        symbols[chosen] = ord(feature.symbol)
+    order = np.lexsort((-np.arange(len(types)), -priorities))
+    order = order[priorities[order] < background_priority]
+    for start, end, symbol in zip(starts[order].tolist(), ends[order].tolist(), symbols[order].tolist()):
+        painted[start: end + 1] = symbol
+    return painted
+
+
 def create_fasta_from_annotation(gff, scaffold_names, scaffold_lengths=None, output_path=None, features=None,
                                  annotation_width=100, base_width=100):
     from DNASkittleUtils.Contigs import write_contigs_to_file, Contig
@@ -283,32 +623,27 @@ def create_fasta_from_annotation(gff, scaffold_names, scaffold_lengths=None, out
     if isinstance(gff, str):
         gff = parseGFF(gff)  # gff parameter was a filename
     chromosome_lengths = gather_chromosome_lengths(gff)
+    if annotation_width != base_width:
+        print("Squishing annotation by %i / %i" % (base_width, annotation_width))
     count = 0
     scaffolds = []
     for sc_index, scaff_name in enumerate(scaffold_names):  # Exact match required (case sensitive)
         if scaff_name in gff.keys():
-            seq_array = editable_str(gap_char * (chromosome_lengths[scaff_name] + 1))
-            for entry in gff[scaff_name]:
-                assert isinstance(entry, GFFAnnotation), "This isn't a proper GFF object"
-                if entry.type in features.keys():
-                    count += 1
-                    my = features[entry.type]
-                    for i in range(entry.start, entry.end + 1):
-                        if symbol_priority[seq_array[i]] > my.priority :
-                            seq_array[i] = my.symbol
-                if entry.type == 'gene':
-                    # TODO: output header JSON every time we find a gene
-                    pass
-            handle_tail(seq_array, scaffold_lengths, sc_index)
-            scaffolds.append(Contig(scaff_name, ''.join(seq_array)))
+            starts, ends, types = feature_columns(gff[scaff_name])
+            length = chromosome_lengths[scaff_name] + 1
+            if scaffold_lengths is not None:  # pad the tail out to the full scaffold
+                length = max(length, scaffold_lengths[sc_index])
+            painted = paint_features(length, starts, ends, types, features, symbol_priority[gap_char])
+            count += sum(int(np.count_nonzero(types == name)) for name in features)
+            if annotation_width != base_width:
+                painted = squish_codes(painted, annotation_width, base_width)
+            scaffolds.append(Contig(scaff_name, painted.tobytes().decode('latin-1')))
         else:
             print("No matches for '%s'" % scaff_name)
     if scaffolds:
         print("Found %i features" % count, "on %i scaffolds" % len(scaffolds))
     else:
         print("WARNING: No matching scaffold names were found between the annotation and the request.")
-    if annotation_width != base_width:
-        scaffolds = squish_fasta(scaffolds, annotation_width, base_width)
     if output_path is not None:
         write_contigs_to_file(output_path, scaffolds)
     return scaffolds
@@ -371,5 +706,4 @@ if __name__ == '__main__':
     # annotation = r'FluentDNA\data\Homo_Sapiens_GRCH38_trimmed.gtf'
     # purge_annotation(annotation)
     path = r"E:\Genomes\Human\Human Unique Annotation merged.fa"
-    squished = squish_fasta(read_contigs(path), 20, 100)
-    write_contigs_to_file(path + "_squished.fa", squished)
+    squish_fasta_file(path, path + "_squished.fa", 20, 100)
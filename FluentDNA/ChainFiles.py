@@ -1,3 +1,10 @@
+import mmap
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+
 class ChainEntry(object):
     def __init__(self, size, gap_query, gap_ref):
         self.size, self.gap_query, self.gap_ref = size, gap_query, gap_ref
@@ -23,51 +30,190 @@ class Chain(object):
         self.qEnd = int(qEnd)
         self.chain_id = int(chain_id)
 
-        self.entries = []
+        # one alignment block per element instead of a ChainEntry object each
+        self.sizes = np.zeros(0, dtype=np.int64)
+        self.gaps_query = np.zeros(0, dtype=np.int64)
+        self.gaps_ref = np.zeros(0, dtype=np.int64)
 
 
     def __str__(self):
         return 'chain %i %s %i %s %i %i %s %i %s %i %i %i' % (self.score, self.tName, self.tSize, self.tStrand, self.tStart, self.tEnd,
                                                               self.qName, self.qSize, self.qStrand, self.qStart, self.qEnd, self.chain_id)
 
-    def add_entry(self, line):
-        pieces = line.split()
-        size, gap_query, gap_ref = 0, 0, 0
-        if len(pieces) == 3:
-            size, gap_query, gap_ref = [int(x) for x in pieces]
-        elif len(pieces) == 1:
-            size = int(pieces[0])
-        elif len(pieces):  # non-empty
-            raise ValueError("Don't know how to parse line: " + line)
-        self.entries.append(ChainEntry(size, gap_query, gap_ref))
+    @property
+    def entries(self):
+        """ChainEntry objects built on demand.  Use blocks() to avoid making the objects."""
+        return [ChainEntry(*block) for block in self.blocks()]
+
+    def blocks(self):
+        """(size, gap_query, gap_ref) ints for each alignment block"""
+        return zip(self.sizes.tolist(), self.gaps_query.tolist(), self.gaps_ref.tolist())
+
+    def ref_intervals(self):
+        """(begins, ends) arrays of each aligned block in reference coordinates"""
+        steps = np.cumsum(self.sizes + self.gaps_query)
+        begins = self.tStart + np.concatenate(([0], steps[:-1])).astype(np.int64)
+        return begins, begins + self.sizes
+
+    def set_blocks(self, body):
+        """Parses the lines after the chain header: 'size gap gap' lines and a final 'size' line.
+        Blank lines become 0 size blocks, the same as they always have."""
+        lines = body.split(b'\n')
+        if lines and not lines[-1]:
+            lines.pop()  # nothing after the last newline
+        lines = [line for line in lines if not line.startswith(b'#')]
+        filled = len(lines)
+        while filled and not lines[filled - 1].strip():
+            filled -= 1  # blank lines between chains
+        blanks = len(lines) - filled
+        columns = [len(line.split()) for line in lines[:filled]]
+        if filled and columns[-1] == 1 and columns.count(3) == filled - 1:
+            numbers = np.array(b' '.join(lines[:filled]).split(), dtype=np.int64)
+            self.sizes = np.append(numbers[0::3], np.zeros(blanks, dtype=np.int64))
+            self.gaps_query = np.append(numbers[1::3], np.zeros(blanks + 1, dtype=np.int64))
+            self.gaps_ref = np.append(numbers[2::3], np.zeros(blanks + 1, dtype=np.int64))
+            return
+        blocks = []  # unusual layout, one line at a time
+        for line in lines:
+            pieces = line.split()
+            if len(pieces) == 3:
+                blocks.append([int(x) for x in pieces])
+            elif len(pieces) == 1:
+                blocks.append([int(pieces[0]), 0, 0])
+            elif len(pieces):  # non-empty
+                raise ValueError("Don't know how to parse line: " + line.decode())
+            else:
+                blocks.append([0, 0, 0])
+        blocks = np.array(blocks, dtype=np.int64).reshape(-1, 3)
+        self.sizes, self.gaps_query, self.gaps_ref = blocks[:, 0], blocks[:, 1], blocks[:, 2]
+
+
+class ChainRecord(object):
+    """Where one chain is in the .chain file, one line of the .cidx index"""
+    def __init__(self, score, tName, tSize, qName, offset, length):
+        self.score = score
+        self.tName = tName
+        self.tSize = tSize
+        self.qName = qName
+        self.offset = offset
+        self.length = length
+
+
+class ChainIndex(object):
+    """The chains of a .chain file grouped by reference chromosome.  Only the .cidx records are
+    kept in memory, chains() reads and parses one chromosome's chains when they're needed."""
+    def __init__(self, chain_name, extract_contigs=None):
+        self.chain_name = chain_name
+        self.by_target = OrderedDict()  # tName: [ChainRecord] biggest score first
+        for record in sorted(chain_index(chain_name), key=lambda r: -r.score):  # file order breaks ties
+            if extract_contigs is None or record.qName in extract_contigs or record.tName in extract_contigs:
+                self.by_target.setdefault(record.tName, []).append(record)
+
+    def records(self, chromosome):
+        """Records for every tName that matches chromosome, biggest score first"""
+        found = [record for tName, records in self.by_target.items()
+                 if match(tName, chromosome) or match(chromosome, tName) for record in records]
+        found.sort(key=lambda r: -r.score)
+        return found
+
+    def chains(self, chromosome):
+        return read_chains(self.chain_name, self.records(chromosome))
+
+    def size(self, chromosome):
+        """Biggest tSize in the chains for chromosome, 0 if there aren't any"""
+        return max([record.tSize for record in self.records(chromosome)] + [0])
+
+
+def index_path(chain_name):
+    return chain_name + '.cidx'
+
+
+index_version = 2  # first line of the .cidx, with the size of the chain file it was made from
+
+
+def load_chain_index(chain_name):
+    """Reuses the .cidx next to the chain file if it's newer and was made from a file of the same size."""
+    index = index_path(chain_name)
+    if not os.path.exists(index) or os.path.getmtime(index) < os.path.getmtime(chain_name):
+        return None
+    records = []
+    with open(index) as index_file:
+        if index_file.readline().strip() != '#%i\t%i' % (index_version, os.path.getsize(chain_name)):
+            return None
+        for line in index_file:
+            score, tName, tSize, qName, offset, length = line.rstrip('\n').split('\t')
+            records.append(ChainRecord(int(score), tName, int(tSize), qName, int(offset), int(length)))
+    return records
+
+
+def build_chain_index(chain_name):
+    """Finds each 'chain' header line in file order without parsing the alignment blocks."""
+    records = []
+    if not os.path.getsize(chain_name):
+        return records
+    with open(chain_name, 'rb') as chain_file:
+        mapped = mmap.mmap(chain_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            position = 0
+            if mapped[:5] != b'chain':  # comments before the first chain
+                position = mapped.find(b'\nchain')
+                position = -1 if position == -1 else position + 1
+            while position != -1:
+                header_end = mapped.find(b'\n', position)
+                header_end = len(mapped) if header_end == -1 else header_end
+                next_chain = mapped.find(b'\nchain', header_end)
+                end = len(mapped) if next_chain == -1 else next_chain + 1
+                fields = mapped[position:header_end].decode().split()
+                if len(fields) != 13:
+                    raise ValueError("Don't know how to parse chain header: " + ' '.join(fields))
+                records.append(ChainRecord(int(fields[1]), fields[2], int(fields[3]), fields[7],
+                                           position, end - position))
+                position = -1 if next_chain == -1 else next_chain + 1
+        finally:
+            mapped.close()
+    return records
+
+
+def save_chain_index(chain_name, records):
+    """Silently skips folders that aren't writeable"""
+    try:
+        with open(index_path(chain_name), 'w') as index:
+            index.write('#%i\t%i\n' % (index_version, os.path.getsize(chain_name)))
+            for r in records:
+                index.write('%i\t%s\t%i\t%s\t%i\t%i\n' % (r.score, r.tName, r.tSize, r.qName, r.offset, r.length))
+    except (IOError, OSError):
+        pass
+
+
+def chain_index(chain_name):
+    records = load_chain_index(chain_name)
+    if records is None:
+        records = build_chain_index(chain_name)
+        save_chain_index(chain_name, records)
+    return records
 
 
 def chain_file_to_list(chain_name, extract_contigs=None):
-    """Return a list of Chain objects from a liftover .chain filename"""
+    """Return a list of Chain objects from a liftover .chain filename, biggest score first.
+    Uses the .cidx index to only read the chains that touch extract_contigs."""
+    records = [r for r in chain_index(chain_name)
+               if extract_contigs is None or r.qName in extract_contigs or r.tName in extract_contigs]
+    records.sort(key=lambda r: -r.score)  # biggest score first, file order breaks ties
+    return read_chains(chain_name, records)
+
+
+def read_chains(chain_name, records):
+    """Chain objects for each ChainRecord, in the same order"""
     all_chains = []
-    new_chain = None
-    skipping_current_chain = False
-    with open(chain_name, 'r') as infile:
-        for line in infile.readlines():
-            if line.startswith('#'):
-                continue  # this is a comment, no seriously, the line in the chain file is commented out
-            if line.startswith('chain'):
-                if new_chain is not None:
-                    all_chains.append(new_chain)
-                    new_chain = None
-                current_chain = Chain(line)
-                if extract_contigs is None \
-                        or current_chain.qName in extract_contigs \
-                        or current_chain.tName in extract_contigs:
-                    new_chain = current_chain
-                    skipping_current_chain = False
-                else:
-                    skipping_current_chain = True
-            elif not skipping_current_chain:
-                new_chain.add_entry(line)
-    if new_chain is not None:
-        all_chains.append(new_chain)
-    all_chains.sort(key=lambda chain: -chain.score)  # biggest score first
+    with open(chain_name, 'rb') as infile:
+        for record in records:
+            infile.seek(record.offset)
+            text = infile.read(record.length)
+            header_end = text.find(b'\n')
+            header_end = len(text) if header_end == -1 else header_end
+            new_chain = Chain(text[:header_end].decode())
+            new_chain.set_blocks(text[header_end + 1:])
+            all_chains.append(new_chain)
     return all_chains
 
 
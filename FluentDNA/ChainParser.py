@@ -1,32 +1,36 @@
 from __future__ import print_function, division, absolute_import, \
     with_statement, generators, nested_scopes
 
+import multiprocessing
 import os
-import sys
 import traceback
-from collections import namedtuple
-
-try:
-    from blist import blist
-except ImportError:
-    print("Note: blist is not installed.  \n",
-          "If you are visualizing whole genome alignments, you can get better performance by:\n"
-          " pip install blist and/or Visual C++ lib 14", file=sys.stderr)
-    blist = list  # issue warning if used
-
-
+from collections import namedtuple, deque, OrderedDict
 
+import numpy as np
+import psutil
 from DNASkittleUtils.CommandLineUtils import just_the_name
 from DNASkittleUtils.Contigs import pluck_contig, write_complete_fasta
-from DNASkittleUtils.DDVUtils import first_word, ReverseComplement, BlankIterator, editable_str
+from DNASkittleUtils.DDVUtils import first_word, BlankIterator, editable_str
 from FluentDNA.DefaultOrderedDict import DefaultOrderedDict
-from FluentDNA.ChainFiles import chain_file_to_list, match
-from FluentDNA.FluentDNAUtils import make_output_directory, keydefaultdict, read_contigs_to_dict, copy_to_sources
-from FluentDNA.Span import AlignedSpans, Span, alignment_chopping_index
+from FluentDNA.ChainFiles import ChainIndex, match
+from FluentDNA.FastaIndex import ReverseComplementView
+from FluentDNA.FluentDNAUtils import make_output_directory, read_contigs_to_dict, copy_to_sources
+from FluentDNA.Span import AlignedSpans, AlignmentList, Span, alignment_chopping_index
 from FluentDNA import gap_char
 from FluentDNA.TileLayout import hex_to_rgb
 
 Batch = namedtuple('Batch', ['chr', 'fastas', 'output_folder'])
+TranslocationMark = namedtuple('TranslocationMark', ['char', 'fill', 'legend', 'color'])
+chain_worker = None  # copy of the ChainParser in each parse_chain() worker process
+
+
+def init_chain_worker(parser):
+    global chain_worker
+    chain_worker = parser
+
+
+def do_chromosome_in_worker(chromosome):
+    return chain_worker.do_chromosome(chromosome)
 
 
 def scan_past_header(seq, index, take_shortcuts=False, skip_newline=True):
@@ -47,6 +51,63 @@ def scan_past_header(seq, index, take_shortcuts=False, skip_newline=True):
     return index
 
 
+def character_codes(seq):
+    """numpy view of an editable_str() for comparing whole sequences at once.  No copy is made."""
+    return np.frombuffer(seq, dtype={1: np.uint8, 2: np.uint16, 4: np.uint32}[seq.itemsize])
+
+
+def sequence_positions(codes):
+    """Every index that calling scan_past_header() before each character would land on, in order.
+    Headers are rare, so only the newlines, '>' and ';' are visited in Python.  None means every index."""
+    special = np.flatnonzero((codes == ord('\n')) | (codes == ord('>')) | (codes == ord(';')))
+    if not len(special):
+        return None
+    newlines = special[codes[special] == ord('\n')]
+    skipped = np.zeros(len(codes), dtype=bool)
+
+    def scan(index):
+        if codes[index] == ord('\n'):  # skip newline marking the end of a contig
+            skipped[index] = True
+            index += 1
+        if index < len(codes) and codes[index] in (ord('>'), ord(';')):
+            after = np.searchsorted(newlines, index)
+            header_end = int(newlines[after]) + 1 if after < len(newlines) else len(codes)
+            skipped[index:header_end] = True
+            index = header_end
+        return index
+
+    next_scan = scan(0)  # the first character is scanned twice
+    for index in special.tolist():
+        if index >= next_scan:  # otherwise it was skipped or read as sequence without a scan
+            next_scan = scan(index) + 1  # the character after a header is read without another scan
+    return np.flatnonzero(~skipped)
+
+
+def piece_length(pieces):
+    """Length of a list of text and (character, count) pieces"""
+    return sum(piece[1] if isinstance(piece, tuple) else len(piece) for piece in pieces)
+
+
+def assemble_pieces(existing, pieces):
+    """Appends text and (character, count) pieces to the editable_str existing, growing it once to its final size"""
+    position = len(existing)
+    filler = editable_str(gap_char) * piece_length(pieces)
+    if position:
+        existing.extend(filler)
+    else:
+        existing = filler
+    for piece in pieces:
+        if isinstance(piece, tuple):
+            char, count = piece
+            if char != gap_char and count:
+                existing[position: position + count] = editable_str(char) * count
+            position += count
+        else:
+            existing[position: position + len(piece)] = editable_str(piece)
+            position += len(piece)
+    return existing
+
+
 def initial_stats():
     """Stats should not use a defaultdict as this is in the inner loop."""
     return {
@@ -66,14 +127,20 @@ def initial_stats():
             'Ref Gaps larger than 10bp': 0,
             'Ref Gaps larger than 100bp': 0,
             'Ref Gaps larger than 1000bp': 0,
+            'Reverse complement cache hits': 0,
+            'Reverse complement cache misses': 0,
+            'Reverse complement cache evictions': 0,
         }
 
 
 class ChainParser(object):
+    bytes_per_bp = 32  # gapped, unique and markup copies of a chromosome are 4 byte unicode arrays
+    rev_comp_cache_size = 16  # minus strand query contigs kept between switch_sequences() calls
+
     def __init__(self, chain_name, first_source, second_source, output_prefix,
                  trial_run=False, separate_translocations=False, squish_gaps=False,
                  show_translocations_only=False, aligned_only=False, no_titles=False,
-                 extract_contigs=None):
+                 extract_contigs=None, workers=1):
         self.ref_source = first_source  # example hg38ToPanTro4.chain  hg38 is the reference, PanTro4 is the query (has strand flips)
         self.query_source = second_source
         self.output_prefix = output_prefix
@@ -91,19 +158,17 @@ class ChainParser(object):
         self.query_seq_gapped = editable_str('')
         self.ref_seq_gapped = editable_str('')
         self.output_fastas = []
-        self.alignment = blist()  # optimized for inserts in the middle
-        if type(self.alignment) == type([]):
-            print("WARNING: blist library not installed: Genome alignment will be very slow.")
-        self.stored_rev_comps = {}
+        self.alignment = AlignmentList()  # optimized for inserts in the middle
+        self.stored_rev_comps = OrderedDict()  # least recently used first
         self.gapped = '_gapped'
         self.stats = initial_stats()
+        self.workers = workers  # chromosomes parsed at the same time, if there's enough RAM
 
         if self.query_source:
             self.query_contigs = read_contigs_to_dict(self.query_source)
         self.ref_contigs = read_contigs_to_dict(self.ref_source, extract_contigs)
-        self.chain_list = chain_file_to_list(chain_name, extract_contigs)
+        self.chain_index = ChainIndex(chain_name, extract_contigs)  # chains are read one chromosome at a time
 
-        TranslocationMark = namedtuple('TranslocationMark', ['char', 'fill', 'legend', 'color'])
         self.translocation_types = [
             TranslocationMark('T', '-', 'syntenic', hex_to_rgb('#FFFFFF')),  #
             TranslocationMark('A', '.', 'inversion', hex_to_rgb('#E5F3FF')),  #  blue
@@ -112,7 +177,6 @@ class ChainParser(object):
             TranslocationMark('C', 'Z', 'duplicated', hex_to_rgb('#F8E5FF')),  #  purple
             TranslocationMark('N', 'U', 'lost_duplicate', hex_to_rgb('#FFF3E5'))]  #  orange
 
-
     def write_stats_file(self):
         s = self.stats  # alias
         s["Total alignment Length"] = s['Aligned Variance in bp'] + s['Shared seq bp']
@@ -121,6 +185,7 @@ class ChainParser(object):
         s["Alignment Coverage of Ref Chr"] = s["Total alignment Length"] / s["Ref Chr Total Size (No N's)"]
         s["Alignment Coverage of Query Main Chr"] = s['Total alignment Length'] / (
                     s['Total alignment Length'] + s["Query unique bp"])
+        s["Reverse complement cache contigs"] = len(self.stored_rev_comps)  # views, no sequence is copied
         stats_path = os.path.join(self.output_folder, 'sources', 'stats.txt')
         with open(stats_path, 'w+') as stats:
             stats.write('\n===== Alignment Stats ======\n')
@@ -158,58 +223,10 @@ class ChainParser(object):
                                                0))  # len(self.query_sequence) - query_pointer))
             #Not including the unaligned end of query chromosome because it might not be related at all
 
-    def find_old_query_location(self, new_alignment, lo=0, hi=None, depth=0):
-        """Binary search over the _mostly_ sorted list of query indices.
-        Needs special casing to avoid looking at non-master chain entries."""
-        if depth > 30:
-            return False  # abandon hope
-        if hi is None:
-            self.stats['translocation_searched'] += 1
-        hi = hi or len(self.alignment)
-        try:
-            while lo < hi:
-                mid = (lo + hi) // 2
-                # Special handling for accidentally landing on a translocation (not sorted)
-                if not self.alignment[mid].is_master_chain:  # recursively splits the binary search
-                    mid_left, mid_right = mid, mid
-                    # slide left
-                    while not self.alignment[mid_left].is_master_chain:
-                        mid_left -= 1
-                    if not self.find_old_query_location(new_alignment, lo=lo, hi=mid_left, depth=depth + 1):
-                        # slide right
-                        while not self.alignment[mid_right].is_master_chain:
-                            mid_right += 1
-                        return self.find_old_query_location(new_alignment, lo=mid_right, hi=hi, depth=depth + 1)
-                    return True
-                # Actual Binary search is here:
-                if new_alignment.query_less_than(self.alignment[mid]):
-                    hi = mid
-                else:
-                    lo = mid + 1
-        except IndexError:
-            return False
-        # Binary search brings us to the right most position
-        lo = max(lo - 1, 0)
-        final_possible = self.alignment[lo].query_unique_span()
-        # while new_alignment.query.begin not in final_possible and new_alignment.query.end >= final_possible.end:# and lo < hi:
-        #     lo += 1
-        #     final_possible = self.alignment[lo].query_unique_span()
-        if new_alignment.query.begin not in final_possible or new_alignment.query.end not in final_possible:
-            return False  # the old query copy is being used in more than one alignment pair
-        #     # raise ValueError("%s   %s   %s" % tuple(str(self.alignment[x].query_unique_span()) for x in [lo-1, lo, lo+1]))
-        replacements = self.alignment.pop(lo).remove_old_query_copy(new_alignment)
-        [self.alignment.insert(lo, x) for x in reversed(replacements)]  # insert them into alignment in place, in order
-        self.stats['translocation_deleted'] += 1
-
-        print(int(self.stats['translocation_deleted'] / self.stats['translocation_searched'] * 100),
-              "%", self.stats['translocation_searched'], self.stats['translocation_deleted'])
-        return True
-
-
     def process_chain_body(self, chain, ref_pointer, query_pointer, is_master_alignment):
-        assert len(chain.entries), "Chain has no data"
-        for entry_index, entry in enumerate(chain.entries):  # ChainEntry
-            size, gap_query, gap_ref = entry.size, entry.gap_query, entry.gap_ref
+        assert len(chain.sizes), "Chain has no data"
+        for entry_index, (size, entry_gap_query, entry_gap_ref) in enumerate(chain.blocks()):
+            gap_query, gap_ref = entry_gap_query, entry_gap_ref
             first_in_chain = entry_index == 0
             if not size:
                 continue  # entries with 0 size don't count
@@ -230,9 +247,6 @@ class ChainParser(object):
             if is_master_alignment or self.separate_translocations or self.aligned_only:
                 self.alignment.append(new_alignment)
             else:
-                # Remove old unaligned query location
-                # self.find_old_query_location(new_alignment)  # Binary search using query
-
                 # Add new_alignment at ref location
                 scrutiny_index = max(alignment_chopping_index(self.alignment, new_alignment) - 1, 0)  # Binary search
                 try:
@@ -243,17 +257,17 @@ class ChainParser(object):
                 except IndexError as e:
                     print(e)
 
-            if entry.gap_query > 0: self.stats['Query Number of Gaps (all)'] += 1
-            if entry.gap_query > 10: self.stats['Query Gaps larger than 10bp'] += 1
-            if entry.gap_query > 100: self.stats['Query Gaps larger than 100bp'] += 1
-            if entry.gap_query > 1000: self.stats['Query Gaps larger than 1000bp'] += 1
+            if entry_gap_query > 0: self.stats['Query Number of Gaps (all)'] += 1
+            if entry_gap_query > 10: self.stats['Query Gaps larger than 10bp'] += 1
+            if entry_gap_query > 100: self.stats['Query Gaps larger than 100bp'] += 1
+            if entry_gap_query > 1000: self.stats['Query Gaps larger than 1000bp'] += 1
 
-            if entry.gap_ref > 0: self.stats['Ref Number of Gaps (all)'] += 1
-            if entry.gap_ref > 10: self.stats['Ref Gaps larger than 10bp'] += 1
-            if entry.gap_ref > 100: self.stats['Ref Gaps larger than 100bp'] += 1
-            if entry.gap_ref > 1000: self.stats['Ref Gaps larger than 1000bp'] += 1
-            query_pointer += size + entry.gap_ref  # alignable and unalignable block concatenated together
-            ref_pointer += size + entry.gap_query  # two blocks of sequence separated by gap
+            if entry_gap_ref > 0: self.stats['Ref Number of Gaps (all)'] += 1
+            if entry_gap_ref > 10: self.stats['Ref Gaps larger than 10bp'] += 1
+            if entry_gap_ref > 100: self.stats['Ref Gaps larger than 100bp'] += 1
+            if entry_gap_ref > 1000: self.stats['Ref Gaps larger than 1000bp'] += 1
+            query_pointer += size + entry_gap_ref  # alignable and unalignable block concatenated together
+            ref_pointer += size + entry_gap_query  # two blocks of sequence separated by gap
 
             # TODO handle interlacing
         return ref_pointer, query_pointer
@@ -270,86 +284,94 @@ class ChainParser(object):
         Other chromosomes would always return G.  That leaves C for duplications?  We can set a different
         'fill' character for filling in gaps and then change the behavior...
         Let's start with the 3 character experimental generators and see how it goes.  Probably can't keep
-        it from using complementary character for interchromosomal."""
+        it from using complementary character for interchromosomal.
+        Now all three are made in a single pass: each pair contributes pieces, either sampled text
+        or a (character, count) run, and the outputs are allocated once at their final size.
+        With translocation_markup=True, the markup is returned and the gapped sequences are filled as well."""
         if alignment is None:
             alignment = self.alignment
-        query_source_annotation = editable_str('')  # only used if translocation_markup
+        query_pieces, ref_pieces, markup_pieces = [], [], []
+        ref_length = len(self.ref_seq_gapped)  # for padding translocations to the next line
+        markup_char = None
 
         for pair in alignment:
             if previous_chr != (pair.query.contig_name, pair.query.strand):
                 # pair.ref.contig_name could be None
-                if not self.switch_sequences(pair.query.contig_name, pair.query.strand, translocation_markup,
-                                             pair.is_master_chain):
+                if not self.switch_sequences(pair.query.contig_name, pair.query.strand):
                     continue  # skip this pair since it can't be displayed
+                markup_char = self.markup_char(pair.query.contig_name, pair.query.strand, pair.is_master_chain)
             previous_chr = (pair.query.contig_name, pair.query.strand)
 
-            query_snippet = pair.query.sample(self.query_sequence)
+            query_snippet = [pair.query.sample(self.query_sequence)]
+            markup_snippet = [(markup_char, pair.query.size())]
             if not self.aligned_only:
-                query_snippet += pair.query_unique_span().sample(self.query_sequence)
-                query_snippet += gap_char * pair.ref_tail_size  # whenever there is no alignable sequence, it's filled with -'s
+                query_snippet.append(pair.query_unique_span().sample(self.query_sequence))
+                query_snippet.append((gap_char, pair.ref_tail_size))  # whenever there is no alignable sequence, it's filled with -'s
+                markup_snippet.append((markup_char, pair.query_tail_size))
+                markup_snippet.append((gap_char, pair.ref_tail_size))
 
-            ref_snippet = pair.ref.sample(self.ref_sequence)
+            ref_snippet = [pair.ref.sample(self.ref_sequence)]
             if not self.aligned_only:  # Aligned_only simply skips over the unaligned tails
-                ref_snippet += gap_char * pair.query_tail_size  # Ref '-' gap is in the middle, query is at the end, to alternate
-                ref_snippet += pair.ref_unique_span().sample(self.ref_sequence)
+                ref_snippet.append((gap_char, pair.query_tail_size))  # Ref '-' gap is in the middle, query is at the end, to alternate
+                ref_snippet.append(pair.ref_unique_span().sample(self.ref_sequence))
 
+            query_size, ref_size = piece_length(query_snippet), piece_length(ref_snippet)
+            markup_size = piece_length(markup_snippet)
             if pair.is_hidden or self.show_translocations_only and pair.is_master_chain:  # main chain
-                ref_snippet = gap_char * len(ref_snippet)
-                query_snippet = gap_char * len(query_snippet)
+                ref_snippet = [(gap_char, ref_size)]
+                query_snippet = [(gap_char, query_size)]
+                markup_snippet = [(gap_char, markup_size)]
             # TODO: set color to translocation
             elif self.separate_translocations and pair.is_first_entry and not pair.is_master_chain:
-                self.add_translocation_header(pair)
-            if len(query_snippet) != len(ref_snippet):  # make absolute sure we don't step out of phase with bad lengths
-                difference = len(ref_snippet) - len(query_snippet)
-                ref_snippet += gap_char * max(0, -difference)
-                query_snippet += gap_char * max(0, difference)
-
-            assert len(query_snippet) == len(ref_snippet), "Mismatched lengths: " + '\n'.join([ref_snippet, query_snippet])
+                ref_header, query_header = self.add_translocation_header(pair, ref_length)
+                ref_pieces.append(ref_header)
+                query_pieces.append(query_header)
+                ref_length += len(ref_header)
+            # make absolute sure we don't step out of phase with bad lengths
+            query_snippet.append((gap_char, max(0, ref_size - query_size)))
+            ref_snippet.append((gap_char, max(0, query_size - ref_size)))
+            markup_snippet.append((gap_char, max(0, ref_size - markup_size)))
+
+            query_pieces.extend(query_snippet)
+            ref_pieces.extend(ref_snippet)
             if translocation_markup:
-                query_source_annotation.extend(query_snippet)
-            else:  # normal use case
-                self.query_seq_gapped.extend(query_snippet)
-                self.ref_seq_gapped.extend(ref_snippet)
-
-            # else:  # if 'random' not in str(pair) and 'unknown' not in str(pair):  # Only notify me when a
-            #     print("Processed bad alignment pair:\n", pair, "\nRef:", ref_snippet, "\nQry:", query_snippet)
+                markup_pieces.extend(markup_snippet)
+            ref_length += max(query_size, ref_size)
 
+        self.query_seq_gapped = assemble_pieces(self.query_seq_gapped, query_pieces)
+        self.ref_seq_gapped = assemble_pieces(self.ref_seq_gapped, ref_pieces)
         print("Done gapping sequence")
         if translocation_markup:
-            return query_source_annotation
+            return assemble_pieces(editable_str(''), markup_pieces)
         else:
             return self.query_seq_gapped
 
 
-    def switch_sequences(self, query_name, query_strand, translocation_markup=False, is_master_chain=False):
+    def switch_sequences(self, query_name, query_strand):
         """Switch self.query_sequence to the current topic of alignment.
-        Returns True if sucessful, False if the sequence is unavailable."""
+        Returns True if sucessful, False if the sequence is unavailable.
+        The translocation markup characters come from markup_char() instead."""
 
         query_name = query_name.lower()
-        type_to_char = {x.legend: x.char for x in self.translocation_types}
+        # TODO: self.ref_sequence = self.ref_contigs[ref_name]
+        if query_name in self.query_contigs:
+            if query_strand == '-':  # need to load rev_comp
+                self.query_sequence = self.cached_rev_comp(query_name)
+            else:
+                self.query_sequence = self.query_contigs[query_name]
+        else:
+            return self.missing_query_sequence(query_name)
+        return True
 
-        if translocation_markup:  # Replace actual sequence with fake generators
-            if query_name == self.ref_chr_name.lower() or is_master_chain:
-                align_type = 'inversion' if query_strand == '-' else 'syntenic'
-            else:  # differently named scaffold, doesn't matter which strand
-                align_type = 'interchromosomal'
-            self.query_sequence = BlankIterator(type_to_char[align_type])
 
-            if query_name not in self.query_contigs:
-                return False
-            return True
-        else:
-            # TODO: self.ref_sequence = self.ref_contigs[ref_name]
-            if query_name in self.query_contigs:
-                if query_strand == '-':  # need to load rev_comp
-                    if query_name not in self.stored_rev_comps:
-                        self.stored_rev_comps[query_name] = self.rev_comp_contig(query_name)  # caching for performance
-                    self.query_sequence = self.stored_rev_comps[query_name]
-                else:
-                    self.query_sequence = self.query_contigs[query_name]
-            else:
-                return self.missing_query_sequence(query_name)
-            return True
+    def markup_char(self, query_name, query_strand, is_master_chain=False):
+        """The translocation_markup character that stands in for this query sequence"""
+        type_to_char = {x.legend: x.char for x in self.translocation_types}
+        if query_name.lower() == self.ref_chr_name.lower() or is_master_chain:
+            align_type = 'inversion' if query_strand == '-' else 'syntenic'
+        else:  # differently named scaffold, doesn't matter which strand
+            align_type = 'interchromosomal'
+        return type_to_char[align_type]
 
 
     def missing_query_sequence(self, query_name):
@@ -358,7 +380,21 @@ class ChainParser(object):
 
 
     def rev_comp_contig(self, query_name):
-        return ReverseComplement(self.query_contigs[query_name.lower()])
+        return ReverseComplementView(self.query_contigs[query_name.lower()])
+
+
+    def cached_rev_comp(self, query_name):
+        """Keeps the most recently used rev_comp_contig() views, up to rev_comp_cache_size of them"""
+        if query_name in self.stored_rev_comps:
+            self.stored_rev_comps.move_to_end(query_name)
+            self.stats['Reverse complement cache hits'] += 1
+        else:
+            self.stored_rev_comps[query_name] = self.rev_comp_contig(query_name)  # caching for performance
+            self.stats['Reverse complement cache misses'] += 1
+            while len(self.stored_rev_comps) > self.rev_comp_cache_size:
+                self.stored_rev_comps.popitem(last=False)
+                self.stats['Reverse complement cache evictions'] += 1
+        return self.stored_rev_comps[query_name]
 
 
     def setup_chain_start(self, chain, is_master_alignment):
@@ -373,21 +409,21 @@ class ChainParser(object):
         return ref_pointer, query_pointer
 
 
-    def pad_next_line(self):
+    def pad_next_line(self, ref_length):
         column_width = 100
-        characters_remaining = column_width - (len(self.ref_seq_gapped) % column_width)
-        self.ref_seq_gapped.extend(gap_char * characters_remaining)
-        self.query_seq_gapped.extend(gap_char * characters_remaining)
+        characters_remaining = column_width - (ref_length % column_width)
+        return gap_char * characters_remaining
 
 
-    def add_translocation_header(self, alignment):
+    def add_translocation_header(self, alignment, ref_length):
         """ :param alignment: AlignedSpan
-        """
+        :param ref_length: length of the gapped reference so far
+        Returns the (ref, query) text that goes in front of the translocation."""
         if self.no_titles:
-            self.pad_next_line()
-        else:
-            self.ref_seq_gapped.extend('\n>%s_%s_%i\n' % (alignment.ref.contig_name, alignment.ref.strand, alignment.ref.begin))  # visual separators
-            self.query_seq_gapped.extend('\n>%s_%s_%i\n' % (alignment.query.contig_name, alignment.query.strand, alignment.query.begin))
+            padding = self.pad_next_line(ref_length)
+            return padding, padding
+        return ('\n>%s_%s_%i\n' % (alignment.ref.contig_name, alignment.ref.strand, alignment.ref.begin),  # visual separators
+                '\n>%s_%s_%i\n' % (alignment.query.contig_name, alignment.query.strand, alignment.query.begin))
 
         # delete the ungapped query sequence
         # 	delete the query sequence that doesn't match to anything based on the original start, stop, size,
@@ -401,7 +437,6 @@ class ChainParser(object):
         # 	delete parallel query region (hopefully filled with N's)
 
         # insert the gapped versions on both sides
-        pass
 
 
     def write_gapped_fasta(self, reference, query, prepend_output_folder=True):
@@ -433,83 +468,55 @@ class ChainParser(object):
 
 
     def compute_unique_with_markup(self, translocation_markup):
-        query_uniq_array = editable_str(self.query_seq_gapped)
-        ref_uniq_array = editable_str(self.ref_seq_gapped)
-        print("Done allocating unique array")
-        markup_to_fill_char = keydefaultdict(lambda k: k,
-            {m.char: m.fill for m in self.translocation_types})
+        markup_to_fill_char = {m.char: m.fill for m in self.translocation_types}  # other characters stay as is
+        markup = character_codes(translocation_markup)
+        fill_codes = markup.copy()
+        for char, fill in markup_to_fill_char.items():
+            fill_codes[markup == ord(char)] = ord(fill)
+        return self.mark_shared_sequence(fill_codes)
 
-        # query_uniq_array is already initialized to contain header characters
-        q = scan_past_header(self.query_seq_gapped, 0)
-        r = scan_past_header(self.ref_seq_gapped, 0)
-        while q < len(self.query_seq_gapped) and r < len(self.ref_seq_gapped):
-            q = scan_past_header(self.query_seq_gapped,
-                                 q)  # query_uniq_array is already initialized to contain header characters
-            r = scan_past_header(self.ref_seq_gapped, r)
-
-            # only overlapping section
-            q_letter = self.query_seq_gapped[q]
-            r_letter = self.ref_seq_gapped[r]
-            fill_char = markup_to_fill_char[translocation_markup[q]]
-            if q_letter == r_letter:
-                query_uniq_array[q] = fill_char
-                ref_uniq_array[r] = fill_char
-                self.stats['Shared seq bp'] += 1
-            else:  # Not equal
-                if q_letter == 'N':
-                    query_uniq_array[q] = gap_char
-                    self.stats['Query N to ref in bp'] += 1
-                elif r_letter == 'N':
-                    ref_uniq_array[r] = gap_char
-                    self.stats['Ref N to query bp'] += 1
-                else:  # No N's involved
-                    if q_letter == gap_char:
-                        self.stats['Ref unique bp'] += 1
-                    elif r_letter == gap_char:
-                        self.stats['Query unique bp'] += 1
-                    else:
-                        self.stats['Aligned Variance in bp'] += 1
-            q += 1
-            r += 1
 
-        return query_uniq_array, ref_uniq_array
+    def compute_unique_sequence(self):
+        return self.mark_shared_sequence(None)
 
 
-    def compute_unique_sequence(self):
+    def mark_shared_sequence(self, fill_codes, chunk_size=1024 * 1024):
+        """Walks the two gapped sequences in step like scan_past_header() would, replacing shared
+        sequence with fill_codes (gap_char if None) and N's with gap_char, and counting each kind
+        of difference in self.stats.  Works on a million columns at a time with numpy."""
         query_uniq_array = editable_str(self.query_seq_gapped)
         ref_uniq_array = editable_str(self.ref_seq_gapped)
         print("Done allocating unique array")
+        query, ref = character_codes(self.query_seq_gapped), character_codes(self.ref_seq_gapped)
+        query_uniq, ref_uniq = character_codes(query_uniq_array), character_codes(ref_uniq_array)
         # query_uniq_array is already initialized to contain header characters
-        q = scan_past_header(self.query_seq_gapped, 0)
-        r = scan_past_header(self.ref_seq_gapped, 0)
-        while q < len(self.query_seq_gapped) and r < len(self.ref_seq_gapped):
-            q = scan_past_header(self.query_seq_gapped, q)  # query_uniq_array is already initialized to contain header characters
-            r = scan_past_header(self.ref_seq_gapped, r)
-
-            # only overlapping section
-            q_letter = self.query_seq_gapped[q]
-            r_letter = self.ref_seq_gapped[r]
-            if q_letter == r_letter:
-                query_uniq_array[q] = gap_char
-                ref_uniq_array[r] = gap_char
-                self.stats['Shared seq bp'] += 1
-            else:  # Not equal
-                if q_letter == 'N':
-                    query_uniq_array[q] = gap_char
-                    self.stats['Query N to ref in bp'] += 1
-                elif r_letter == 'N':
-                    ref_uniq_array[r] = gap_char
-                    self.stats['Ref N to query bp'] += 1
-                else:  # No N's involved
-                    if q_letter == gap_char:
-                        self.stats['Ref unique bp'] += 1
-                    elif r_letter == gap_char:
-                        self.stats['Query unique bp'] += 1
-                    else:
-                        self.stats['Aligned Variance in bp'] += 1
-            q += 1
-            r += 1
-
+        query_visits, ref_visits = sequence_positions(query), sequence_positions(ref)
+        gap, n = ord(gap_char), ord('N')
+        pairs = min(len(query) if query_visits is None else len(query_visits),
+                    len(ref) if ref_visits is None else len(ref_visits))  # only overlapping section
+        for begin in range(0, pairs, chunk_size):
+            end = min(pairs, begin + chunk_size)
+            q = np.arange(begin, end) if query_visits is None else query_visits[begin:end]
+            r = np.arange(begin, end) if ref_visits is None else ref_visits[begin:end]
+            q_letters, r_letters = query[q], ref[r]
+            shared = q_letters == r_letters
+            query_n = ~shared & (q_letters == n)
+            ref_n = ~shared & ~query_n & (r_letters == n)
+            different = ~shared & ~query_n & ~ref_n  # No N's involved
+            fill = gap if fill_codes is None else fill_codes[q[shared]]
+            query_uniq[q[shared]] = fill
+            ref_uniq[r[shared]] = fill
+            query_uniq[q[query_n]] = gap
+            ref_uniq[r[ref_n]] = gap
+            ref_unique = different & (q_letters == gap)
+            query_unique = different & ~ref_unique & (r_letters == gap)
+            self.stats['Shared seq bp'] += int(np.count_nonzero(shared))
+            self.stats['Query N to ref in bp'] += int(np.count_nonzero(query_n))
+            self.stats['Ref N to query bp'] += int(np.count_nonzero(ref_n))
+            self.stats['Ref unique bp'] += int(np.count_nonzero(ref_unique))
+            self.stats['Query unique bp'] += int(np.count_nonzero(query_unique))
+            self.stats['Aligned Variance in bp'] += int(np.count_nonzero(different & ~ref_unique & ~query_unique))
+        del query_uniq, ref_uniq  # release the buffers so the arrays can be resized again
         return query_uniq_array, ref_uniq_array
 
 
@@ -517,7 +524,7 @@ class ChainParser(object):
         """In panTro4ToHg38.over.chain there are ZERO chains that have a negative strand on the reference 'tStrand'.
         I think it's a rule that you always flip the query strand instead."""
         # This assumes the chains have been sorted by score, so the highest score is the matching query_chr
-        relevant_chains = [chain for chain in self.chain_list if match(chain.tName, ref_chr)]
+        relevant_chains = [chain for chain in self.chain_index.chains(ref_chr) if match(chain.tName, ref_chr)]
         if not relevant_chains:
             raise ValueError("Unable to find any chain matches for %s" % ref_chr)
         previous = None
@@ -546,13 +553,12 @@ class ChainParser(object):
         self.query_seq_gapped = editable_str('')
         self.ref_seq_gapped = editable_str('')
         self.output_fastas = []
-        self.alignment = blist()  # Alignment is specific to the chromosome
+        self.alignment = AlignmentList()  # Alignment is specific to the chromosome
         self.stats = initial_stats()
         if ref_chr in self.ref_contigs:
             self.ref_sequence = self.ref_contigs[ref_chr]  # only need the reference chromosome read, skip the others
         else:
             self.ref_sequence = pluck_contig(ref_chr, self.ref_source)
-        # self.chain_list = chain_file_to_list(chain_name)
         copy_to_sources(self.output_folder, self.ref_source)
         copy_to_sources(self.output_folder, self.query_source)
         return names, ref_chr
@@ -562,7 +568,6 @@ class ChainParser(object):
         print("=== Begin ChainParser Unique Alignment ===")
         names, ref_chr = self.setup_for_reference_chromosome(chromosome_name)
         self.create_alignment_from_relevant_chains(ref_chr)
-        self.create_fasta_from_composite_alignment()
         translocation_markup = self.create_fasta_from_composite_alignment(translocation_markup=True)
 
         names['ref_gapped'], names['query_gapped'] = self.write_gapped_fasta(names['ref'], names['query'])
@@ -592,17 +597,49 @@ class ChainParser(object):
 
     def parse_chain(self, chromosomes):# -> list:
         assert isinstance(chromosomes, list), "'Chromosomes' must be a list! A single element list is okay."
+        return [batch for batch in self.map_chromosomes(chromosomes) if batch is not None]
 
-        batches = []
-        for chromosome in chromosomes:
-            try:
-                result = self._parse_chromosome_in_chain(chromosome)
-                batches.append(result)
-            except BaseException as e:
-                print("Encountered exception while parsing chromosome alignment: ")
-                traceback.print_exc()
-                print("Continuing to next chromosome.")
-        return batches
-        # workers = multiprocessing.Pool(6)  # number of simultaneous processes. Watch your RAM usage
-        # workers.map(self._parse_chromosome_in_chain, chromosomes)
+    def do_chromosome(self, chromosome):
+        try:
+            return self._parse_chromosome_in_chain(chromosome)
+        except BaseException as e:
+            print("Encountered exception while parsing chromosome alignment: ")
+            traceback.print_exc()
+            print("Continuing to next chromosome.")
+            return None  # Error return value
+
+    def memory_estimate(self, chromosome):
+        """Rough bytes needed to parse one reference chromosome, from its size in the chain file"""
+        return self.chain_index.size(chromosome) * self.bytes_per_bp
+
+    def map_chromosomes(self, chromosomes):
+        """do_chromosome() for each chromosome, results in the same order.  With more than one worker
+        each chromosome runs in a worker process.  A chromosome only starts when the estimates of the
+        ones already running leave room for it in the RAM that was available at the start."""
+        if self.workers <= 1 or len(chromosomes) <= 1:
+            return [self.do_chromosome(chromosome) for chromosome in chromosomes]
+        budget = psutil.virtual_memory().available
+        waiting = deque(enumerate(chromosomes))
+        results = [None] * len(chromosomes)
+        running = {}  # index: (AsyncResult, memory estimate)
+        pool = multiprocessing.Pool(self.workers, initializer=init_chain_worker, initargs=(self,))
+        try:
+            while waiting or running:
+                while waiting and len(running) < self.workers:
+                    index, chromosome = waiting[0]
+                    needed = self.memory_estimate(chromosome)
+                    in_use = sum(estimate for result, estimate in running.values())
+                    if running and in_use + needed > budget:
+                        break  # wait for a running chromosome to finish and free its memory
+                    waiting.popleft()
+                    print("Parsing", chromosome, "in a worker process, estimated %i MB" % (needed // 2 ** 20))
+                    running[index] = (pool.apply_async(do_chromosome_in_worker, (chromosome,)), needed)
+                oldest = min(running)
+                running[oldest][0].wait(0.5)
+                for index in [i for i, (result, estimate) in running.items() if result.ready()]:
+                    results[index] = running.pop(index)[0].get()
+        finally:
+            pool.terminate()
+            pool.join()
+        return results
 
@@ -0,0 +1,251 @@
+from __future__ import print_function, division, absolute_import, \
+    with_statement, generators, nested_scopes
+
+import mmap
+import os
+import sys
+
+import numpy as np
+from DNASkittleUtils.Contigs import Contig, read_contigs
+from DNASkittleUtils.DDVUtils import nucleotide_complements
+
+open_files = {}  # path: mmap shared by every SequenceView in this process
+complement_table = {ord(k): v for k, v in nucleotide_complements.items()}
+
+
+class FaiRecord(object):
+    """One line of a samtools style .fai index.  name is the full header line, not just the first word."""
+    def __init__(self, name, length, offset, line_bases, line_bytes):
+        self.name = name
+        self.length = length
+        self.offset = offset  # byte position of the first nucleotide
+        self.line_bases = line_bases
+        self.line_bytes = line_bytes
+
+
+class SequenceView(object):
+    """Read only stand in for a contig's sequence string, backed by a memory mapped FASTA file.
+    Slicing returns an upper case str without newlines, the same as read_contigs() would have
+    stored, so only the part that is used gets read.  Views can be pickled for worker processes,
+    which map the file again for themselves."""
+    def __init__(self, fasta_path, record):
+        self.fasta_path = fasta_path
+        self.offset = record.offset
+        self.length = record.length
+        self.line_bases = record.line_bases
+        self.line_bytes = record.line_bytes
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.length)
+            if step == 1:
+                return self.read(start, stop) if start < stop else ''
+            positions = range(start, stop, step)
+            if not len(positions):
+                return ''
+            low, high = min(positions), max(positions) + 1
+            return self.read(low, high)[::step]
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError("Sequence index %i out of range" % key)
+        return self.read(key, key + 1)
+
+    def __iter__(self):
+        step = 1024 * 1024
+        for start in range(0, self.length, step):
+            for letter in self.read(start, min(self.length, start + step)):
+                yield letter
+
+    def __str__(self):
+        return self.read(0, self.length)
+
+    def __repr__(self):
+        return '<SequenceView %s %i:%i>' % (self.fasta_path, self.offset, self.length)
+
+    def byte_position(self, index):
+        return self.offset + (index // self.line_bases) * self.line_bytes + index % self.line_bases
+
+    def read(self, start, stop):
+        raw = mapped_file(self.fasta_path)[self.byte_position(start): self.byte_position(stop)]
+        if self.line_bytes != self.line_bases:
+            raw = raw.replace(b'\n', b'').replace(b'\r', b'')
+        return raw.upper().decode('latin-1')
+
+
+class ReverseComplementView(object):
+    """Minus strand of a sequence, read the same way as DNASkittleUtils' ReverseComplement but with
+    str.translate on each slice instead of a lookup per letter.  Only holds a reference to seq,
+    which is usually a SequenceView, so nothing is copied until a slice is asked for.
+    annotation=True reverses without complementing."""
+    def __init__(self, seq, annotation=False):
+        self.seq = seq
+        self.length = len(seq)
+        self.annotation = annotation
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            end = self.length - key.start
+            begin = self.length - key.stop
+            if end < 0 or begin < 0 or end > self.length:
+                raise IndexError("%i %i vs. length %i" % (end, begin, self.length))
+            piece = str(self.seq[begin: end])[::-1]
+            return piece if self.annotation else piece.translate(complement_table)
+        letter = self.seq[self.length - key - 1]
+        return letter if self.annotation else letter.translate(complement_table)
+
+
+def mapped_file(fasta_path):
+    if fasta_path not in open_files:
+        with open(fasta_path, 'rb') as fasta:
+            open_files[fasta_path] = mmap.mmap(fasta.fileno(), 0, access=mmap.ACCESS_READ)
+    return open_files[fasta_path]
+
+
+def index_path(fasta_path):
+    return fasta_path + '.fai'
+
+
+def load_index(fasta_path):
+    """Reuses an existing .fai next to the FASTA if it's newer than the FASTA.  Header names
+    are read back from the FASTA because samtools only keeps the first word."""
+    fai = index_path(fasta_path)
+    if not os.path.exists(fai) or os.path.getmtime(fai) < os.path.getmtime(fasta_path):
+        return None
+    mapped = mapped_file(fasta_path)
+    records = []
+    with open(fai) as index_file:
+        for line in index_file:
+            columns = line.rstrip('\n').split('\t')
+            if len(columns) < 5:
+                return None
+            length, offset, line_bases, line_bytes = (int(x) for x in columns[1:5])
+            header_end = mapped.rfind(b'\n', 0, offset)
+            header_start = mapped.rfind(b'\n', 0, max(0, header_end)) + 1
+            header = mapped[header_start:header_end].rstrip(b'\r')
+            if not header.startswith(b'>'):
+                return None  # index doesn't belong to this file
+            records.append(FaiRecord(header[1:].decode('utf-8', 'replace'), length, offset,
+                                     line_bases, line_bytes))
+    return records
+
+
+def build_index(fasta_path, chunk_size=64 * 1024 * 1024):
+    """Scans the FASTA once for headers and line lengths.  Returns None if the file can't be
+    indexed: lines of different lengths inside a record, blank lines, Windows line endings,
+    sequence before the first header or non-ASCII bytes.  Those files use read_contigs()."""
+    mapped = mapped_file(fasta_path)
+    size = len(mapped)
+    if not size or mapped[0:1] != b'>':
+        return None
+    records = []
+    position = 0
+    while position < size:
+        header_end = mapped.find(b'\n', position)
+        if header_end == -1:
+            header_end = size
+        header = mapped[position + 1: header_end]
+        next_header = mapped.find(b'\n>', header_end)
+        body_start, body_end = header_end + 1, size if next_header == -1 else next_header + 1
+        position = body_end
+        while body_end > body_start and mapped[body_end - 1: body_end] == b'\n':
+            body_end -= 1  # trailing blank lines are harmless
+        body_start = min(body_start, body_end)
+        body = np.frombuffer(mapped, dtype=np.uint8, count=body_end - body_start, offset=body_start)
+        newlines = 0
+        for start in range(0, len(body), chunk_size):
+            chunk = body[start: start + chunk_size]
+            if chunk.max() > 127 or np.count_nonzero(chunk == ord('\r')):
+                return None
+            newlines += int(np.count_nonzero(chunk == ord('\n')))
+        if b'\r' in header or any(c > 127 for c in bytearray(header)):
+            return None
+        line_bases = mapped.find(b'\n', body_start, body_end) - body_start if newlines else len(body)
+        length = len(body) - newlines
+        if newlines:  # every full line has the same length and ends where expected
+            if line_bases <= 0 or newlines != (length - 1) // line_bases or \
+                    np.count_nonzero(body[line_bases::line_bases + 1] != ord('\n')):
+                return None
+        records.append(FaiRecord(header.decode('ascii'), length, body_start,
+                                 max(1, line_bases), max(1, line_bases) + 1))
+    return records
+
+
+def save_index(fasta_path, records):
+    """Writes a samtools compatible .fai.  Silently skips folders that aren't writeable."""
+    try:
+        with open(index_path(fasta_path), 'w') as fai:
+            for record in records:
+                fai.write('%s\t%i\t%i\t%i\t%i\n' % (record.name.split()[0] if record.name.split() else '',
+                                                   record.length, record.offset,
+                                                   record.line_bases, record.line_bytes))
+    except (IOError, OSError):
+        pass
+
+
+def indexed_records(fasta_path):
+    """FaiRecords for every contig, from the .fai if it's current, otherwise from a fresh scan
+    which is saved for next time.  None if the file can't be indexed."""
+    fasta_path = os.path.abspath(fasta_path)
+    stale = open_files.pop(fasta_path, None)  # the file may have been rewritten since it was mapped
+    if stale is not None:
+        stale.close()  # views map the file again on their next read
+    records = None
+    try:
+        records = load_index(fasta_path)
+        if records is None:
+            records = build_index(fasta_path)
+            if records is not None:
+                save_index(fasta_path, records)
+    except (IOError, OSError, ValueError) as e:
+        print("Unable to index", fasta_path, e, file=sys.stderr)
+    if records is None:
+        return None
+    # read_contigs() drops records without sequence, except for the last one
+    return [r for i, r in enumerate(records) if r.length or i == len(records) - 1]
+
+
+def read_indexed_contigs(fasta_path):
+    """Drop in replacement for read_contigs() that returns Contigs whose seq is a SequenceView.
+    Falls back to read_contigs() for files that can't be indexed."""
+    records = indexed_records(fasta_path)
+    if records is None:
+        return read_contigs(fasta_path)
+    fasta_path = os.path.abspath(fasta_path)
+    return [Contig(record.name, SequenceView(fasta_path, record)) for record in records]
+
+
+class SequenceLength(object):
+    """Stands in for a sequence when only its length is known, for planning a layout."""
+    def __init__(self, length):
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+
+def scan_contig_lengths(fasta_path):
+    """(name, length) of each record the way read_contigs() would see them, one line at a time
+    so no sequence is kept.  For files that can't be indexed.  Raises UnicodeDecodeError
+    like read_contigs()."""
+    lengths = []
+    name, length = '', 0
+    with open(fasta_path, 'r') as fasta:
+        for line in fasta:
+            line = line.rstrip('\r\n')
+            if not line:
+                continue
+            if line[0] == '>':
+                if length:
+                    lengths.append((name, length))
+                name, length = line[1:], 0
+            else:
+                length += len(line)
+    lengths.append((name, length))
+    return lengths
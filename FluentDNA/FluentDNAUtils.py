@@ -8,8 +8,8 @@ import textwrap
 from collections import defaultdict
 from datetime import datetime
 
-from DNASkittleUtils.Contigs import read_contigs
-from PIL import ImageDraw
+import numpy as np
+from PIL import Image, ImageDraw
 
 
 class keydefaultdict(defaultdict):
@@ -28,6 +28,33 @@ def multi_line_height(font, multi_line_title, txt):
     return sum_line_spacing + descender
 
 
+def nearest_palette_indices(colors, palette):
+    """Index of the closest color in a flat 768 value palette for each row of RGB colors"""
+    palette = np.array(palette, dtype=np.int32).reshape(-1, 3)
+    distances = ((colors.astype(np.int32)[:, None, :] - palette[None, :, :]) ** 2).sum(axis=2)
+    return distances.argmin(axis=1).astype(np.uint8)
+
+
+def paste_on_canvas(canvas, im, position, mask=None):
+    """Same as canvas.paste(), but also works when canvas is a palette indexed image.  PIL would
+    convert im to its own web palette, so instead the region is blended in RGB and then each
+    pixel is matched to the nearest color already in the canvas palette.  Image.quantize() isn't
+    used for that because its lookup is approximate and turns white into light grey."""
+    if canvas.mode != 'P':
+        canvas.paste(im, position, mask)
+        return
+    x, y = position
+    region = canvas.crop((x, y, x + im.width, y + im.height)).convert('RGB')
+    region.paste(im, (0, 0), mask)
+    rgb = np.asarray(region, dtype=np.uint32).reshape(-1, 3)
+    colors, inverse = np.unique(rgb[:, 0] << 16 | rgb[:, 1] << 8 | rgb[:, 2], return_inverse=True)
+    unique_rgb = np.stack([colors >> 16, colors >> 8 & 255, colors & 255], axis=1)
+    indices = nearest_palette_indices(unique_rgb, canvas.getpalette())[inverse]
+    matched = Image.frombytes('P', region.size, indices.tobytes())
+    matched.putpalette(canvas.getpalette())
+    canvas.paste(matched, (x, y))
+
+
 def pretty_contig_name(contig_name, title_width, title_lines):
     """Since textwrap.wrap break on whitespace, it's important to make sure there's whitespace
     where there should be.  Contig names don't tend to be pretty."""
@@ -65,19 +92,23 @@ def filter_by_contigs(unfiltered, extract_contigs):
 def read_contigs_to_dict(input_file_path, extract_contigs=None):
     print("Reading contigs... ", input_file_path)
     start_time = datetime.now()
-    contig_list = read_contigs(input_file_path)
+    from FluentDNA.FastaIndex import read_indexed_contigs
+    contig_list = read_indexed_contigs(input_file_path)
     contig_list = filter_by_contigs(contig_list, extract_contigs)
     contig_dict = {c.name.lower(): c.seq for c in contig_list}  # capitalization!!!!
     print("Read %i FASTA Contigs in:" % len(contig_dict), datetime.now() - start_time)
     return contig_dict
 
 
-def create_deepzoom_stack(input_image, output_dzi):
+def create_deepzoom_stack(input_image, output_dzi, from_base_tiles=False, workers=1, tile_container=False):
     import FluentDNA.deepzoom
     creator = FluentDNA.deepzoom.ImageCreator(tile_size=256,
                                     tile_overlap=1,
                                     tile_format="png",
-                                    resize_filter="antialias")# cubic bilinear bicubic nearest antialias
+                                    resize_filter="antialias",# cubic bilinear bicubic nearest antialias
+                                    from_base_tiles=from_base_tiles,
+                                    workers=workers,
+                                    tile_container=tile_container)
     creator.create(input_image, output_dzi)
 
 
@@ -196,10 +227,15 @@ def linspace(start, end, steps):
     return [interpolate(start, end, 0, steps - 1, i) for i in range(steps)]
 
 
+def missing_color():
+    """Default palette entry: red will stand out.  A plain function so palettes can be pickled."""
+    return 255, 0, 0
+
+
 def viridis_palette():
     """Hard coded copy of Matplotlib's default color palette.  It is
     perceptually uniform and color blind safe."""
-    palette = defaultdict(lambda: (255, 0, 0))
+    palette = defaultdict(missing_color)
     palette[0] = (68, 1, 84)
     palette[1] = (68, 2, 85)
     palette[2] = (68, 3, 87)
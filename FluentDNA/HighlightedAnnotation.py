@@ -1,6 +1,7 @@
 import traceback
 
 import sys
+import numpy as np
 from PIL import Image, ImageFont
 
 from FluentDNA.Annotations import GFFAnnotation, find_universal_prefix, GFF3Record, parseGFF
@@ -9,20 +10,45 @@ from FluentDNA.TileLayout import TileLayout
 from FluentDNA.FluentDNAUtils import linspace, copy_to_sources
 
 
-def blend_pixel(markup_canvas, pt, c, overwrite=False):
-    if overwrite or markup_canvas[pt[0], pt[1]][3] == 0:  # nothing drawn
-        markup_canvas[pt[0], pt[1]] = c
-    else:
-        remaining_light = 1.0 - (markup_canvas[pt[0], pt[1]][3] / 256)
-        combined_alpha = 256 - int(remaining_light * (256 - c[3]) )
-        markup_canvas[pt[0], pt[1]] = (c[0], c[1], c[2], combined_alpha)
+def blend_mask(pixels, left, top, mask, c):
+    """Draws color c on every True pixel of mask.  Empty pixels simply get c, pixels that were already
+    drawn keep getting darker: their alpha lets through only the light left by both.  pixels is an
+    RGBA array of the markup image indexed [y, x] and mask covers the box starting at left, top."""
+    box = pixels[top: top + mask.shape[0], left: left + mask.shape[1]]
+    alpha = box[..., 3][mask]
+    remaining_light = 1.0 - (alpha / 256)
+    combined_alpha = 256 - (remaining_light * (256 - c[3])).astype(np.int64)
+    blended = np.empty((len(alpha), 4), dtype=np.uint8)
+    blended[:, :3] = c[:3]
+    blended[:, 3] = np.where(alpha == 0, c[3], np.minimum(combined_alpha, 255))
+    box[mask] = blended
+
+
+def blend_points(pixels, points, c):
+    """blend_mask() once for each time a pixel appears in points, an n x 2 array of x, y"""
+    if not len(points):
+        return
+    xs, ys = points[:, 0], points[:, 1]
+    left, top = int(xs.min()), int(ys.min())
+    # the count can't pass len(points), so the smallest type that holds it is enough
+    depth_type = np.uint8 if len(points) < 2 ** 8 else np.uint16 if len(points) < 2 ** 16 else np.uint32
+    coverage = np.zeros((int(ys.max()) - top + 1, int(xs.max()) - left + 1), dtype=depth_type)
+    np.add.at(coverage, (ys - top, xs - left), 1)
+    for depth in range(1, int(coverage.max()) + 1):  # overlapping features darken each time
+        blend_mask(pixels, left, top, coverage >= depth, c)
+
 
 def annotation_points(entry, renderer, start_offset):
+    """n x 2 array of x, y for each position from entry.start to entry.end"""
     # important to include title and reset padding in coordinate frame
     # TODO use unsigned shorts (max 65535) for memory
-    annotation_points = tuple(renderer.position_on_screen(i + start_offset) for i in range(entry.start, entry.end))
+    xs, ys = renderer.positions_on_screen(np.arange(entry.start, entry.end) + start_offset)
+    return np.column_stack((xs, ys)).astype(np.int64).reshape(-1, 2)
+
 
-    return annotation_points
+def union_points(point_arrays):
+    """All the n x 2 point arrays in one, duplicates kept"""
+    return np.concatenate(list(point_arrays) + [np.zeros((0, 2), dtype=np.int64)])
 
 
 class HighlightedAnnotation(TileLayout):
@@ -102,9 +128,8 @@ class HighlightedAnnotation(TileLayout):
                   file=sys.stderr)
             upper_left = [self.border_width, self.border_width]
         # relative coordinates
-        width = max(set(p[0] for region in regions for p in region.points)) + 2 * self.border_width
-        height = max(set(p[1] for region in regions for p in region.points)) + 2* self.border_width
-        markup_image = Image.new('RGBA', (width + 1, height + 1), (0, 0, 0, 0))
+        width, height = union_points(region.points for region in regions).max(axis=0) + 2 * self.border_width
+        markup_image = Image.new('RGBA', (int(width) + 1, int(height) + 1), (0, 0, 0, 0))
 
         self.draw_annotation_outlines(regions, markup_image, color,
                                       simple_entry=simple_entry, shadows=shadows)
@@ -120,67 +145,55 @@ class HighlightedAnnotation(TileLayout):
 
 
     def draw_annotation_outlines(self, regions, markup_image, color, simple_entry, shadows):
-        markup_canvas = markup_image.load()
-        self.draw_annotation_features(markup_canvas, regions, color, highlight_whole_entry=True)
-        if not simple_entry:
-            exon_color = (255, 255, 255, 50)  # white highlighter.  This is less disruptive overall
-            self.draw_annotation_features(markup_canvas, regions, exon_color)  # double down on alpha
-        if shadows:
-            try:
-                annotation_point_union = self.draw_big_shadow_outline(markup_image, regions, (65, 42, 80))
-                self.draw_overlap_shadows(annotation_point_union, markup_image, regions, (65, 42, 80))
-            except MemoryError as e:  # the global union takes a lot of memory
-                print("Ran out of Memory rendering annotation shadows.  Continuing...")
-                print(e)
-
-    def draw_big_shadow_outline(self, markup_image, regions, shadow):
+        pixels = None
+        try:
+            pixels = np.array(markup_image)  # everything is drawn on a copy and pasted back once
+            self.draw_annotation_features(pixels, regions, color, highlight_whole_entry=True)
+            if not simple_entry:
+                exon_color = (255, 255, 255, 50)  # white highlighter.  This is less disruptive overall
+                self.draw_annotation_features(pixels, regions, exon_color)  # double down on alpha
+            if shadows:
+                self.draw_big_shadow_outline(pixels, regions, (65, 42, 80))
+                self.draw_overlap_shadows(pixels, regions, (65, 42, 80))
+        except MemoryError as e:  # the copy and the global union take a lot of memory
+            print("Ran out of Memory rendering annotation highlights.  Continuing...")
+            print(e)
+        if pixels is not None:  # keep whatever was drawn before running out
+            markup_image.paste(Image.fromarray(pixels, 'RGBA'))
+
+    def draw_big_shadow_outline(self, pixels, regions, shadow):
         print("Drawing annotation outlines")
-        annotation_point_union = set()
-        for region in regions:
-            annotation_point_union.update(region.points)
+        points = union_points(region.points for region in regions)
         # desaturated purple drop shadow, decreasing opacity
         opacities = linspace(197, 10, self.border_width)
         outline_colors = [(shadow[0], shadow[1], shadow[2], int(opacity)) for opacity in opacities]
-        big_shadow = outlines(annotation_point_union,
-                              self.border_width, markup_image.width, markup_image.height)
-        self.draw_shadow(big_shadow, markup_image.load(), outline_colors)
-        return annotation_point_union
+        big_shadow = outlines(points, self.border_width, pixels.shape[1], pixels.shape[0])
+        self.draw_shadow(big_shadow, pixels, outline_colors)
 
-    def draw_annotation_features(self, markup_canvas, regions, color, highlight_whole_entry=False):
+    def draw_annotation_features(self, pixels, regions, color, highlight_whole_entry=False):
         print("Drawing exons" if not highlight_whole_entry else "Drawing genic regions")
+        if highlight_whole_entry:
+            points = union_points(region.points for region in regions)
+        else:
+            points = union_points(region.cds_region_points() for region in regions)  # highlight exons
+        blend_points(pixels, points, color)
 
-        for region in regions:
-            if highlight_whole_entry:
-                for point in region.points:  # highlight exons
-                    blend_pixel(markup_canvas, point, color)
-            else:
-                for point in region.cds_region_points():  # highlight exons
-                    blend_pixel(markup_canvas, point, color)
-
-    def draw_overlap_shadows(self, annotation_point_union, markup_image, regions, shadow):
+    def draw_overlap_shadows(self, pixels, regions, shadow):
         """Find subset of genes who are completely overshadowed"""
         print("Drawing secondary shadows")
         opacities = linspace(170, 40, self.border_width // 4)
         outline_colors = [(shadow[0], shadow[1], shadow[2], int(opacity)) for opacity in opacities]
         for region in regions:
-            # if annotation_point_union.issuperset(region.outline_points):
-            region.outline_points = outlines(region.points,  # small outline
-                                             self.border_width // 4, markup_image.width, markup_image.height)
-            # remove this line if you prefer shadow intersection
-            self.draw_shadow(region.outline_points, markup_image.load(), outline_colors)
-            # lost_edge = region.outline_points[0].intersection(annotation_point_union)
-            # if lost_edge:
-            #     lost_shadows = [layer.intersection(annotation_point_union) for layer in region.outline_points]
-            #     self.draw_shadow(lost_shadows, markup_canvas, outline_colors)
-
-
-    def draw_shadow(self, shadow, markup_canvas, outline_colors, flat_color=False):
-        for radius, layer in enumerate(shadow):
+            small_outline = outlines(region.points, self.border_width // 4, pixels.shape[1], pixels.shape[0])
+            self.draw_shadow(small_outline, pixels, outline_colors)
+
+
+    def draw_shadow(self, shadow, pixels, outline_colors, flat_color=False):
+        """Blends each ring of an outlines() shadow as soon as it's grown"""
+        for radius, (left, top, ring) in enumerate(shadow):
             darkness = radius
             # self.border_width - len(region.outline_points) + radius  # softer line for small features
-            c = outline_colors[darkness]
-            for pt in layer:
-                blend_pixel(markup_canvas, pt, c)
+            blend_mask(pixels, left, top, ring, outline_colors[darkness])
 
     def find_annotated_regions(self, annotations, scaff_name, start_offset, no_structure=False):
         """:param start_offset:
@@ -193,7 +206,10 @@ class HighlightedAnnotation(TileLayout):
         if annotations is None:
             return regions
         if scaff_name in annotations.keys():
-            for entry in annotations[scaff_name]:
+            entries = annotations[scaff_name]
+            if not no_structure:  # exons and other features would be skipped anyway
+                entries = entries.of_type(['gene', 'mRNA', 'transcript', 'CDS'])
+            for entry in entries:
                 # redundancy checks for file with both mRNA and gene
                 try:
                     if no_structure:  # life is simple
@@ -231,7 +247,7 @@ class HighlightedAnnotation(TileLayout):
             else:
                 last_unsuppressed_progress = region.start
             try:
-                if not region.points:
+                if not len(region.points):
                     print(region.name(), "has empty coordinates.")
                     break
                 # pts = region.points
@@ -281,29 +297,30 @@ class HighlightedAnnotation(TileLayout):
                                 label_color=label_color)
 
 
-def getNeighbors(x, y):
-    return (x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)
-
-def allNeighbors(x, y):
-    return set(getNeighbors(x, y)).union({(x + 1, y + 1), (x - 1, y - 1),
-                                   (x - 1, y + 1), (x + 1, y - 1)})
-
-def outlines(annotation_points, radius, width, height):
-    workingSet = set(annotation_points)
-    nextEdge = set(annotation_points)
-    layers = []
-    for iterationStep in range(radius, 0,  -1):
-        activeEdge = nextEdge
-        nextEdge = set()
-        for pt in activeEdge:
-            for n in getNeighbors(pt[0], pt[1]):
-                if n not in workingSet \
-                        and width > n[0] > 0 and height > n[1] > 0:  # TODO: check in bounds
-                    workingSet.add(n)
-                    nextEdge.add(n)
-        layers.append(nextEdge)
-
-    return layers
+def outlines(points, radius, width, height):
+    """Rings of pixels 1 to radius steps away from points (an n x 2 array of x, y), stepping to the
+    4 neighbors and never onto the first row or column or past width, height.  Each ring is a boolean
+    mask of the box around the points, found by growing the previous mask one step and keeping
+    what's new.  Yields (left, top, ring) one ring at a time, so each can be drawn before the next
+    one is grown."""
+    if not len(points):
+        return
+    xs, ys = points[:, 0], points[:, 1]
+    left, top = max(0, int(xs.min()) - radius), max(0, int(ys.min()) - radius)
+    right, bottom = min(width, int(xs.max()) + radius + 1), min(height, int(ys.max()) + radius + 1)
+    reached = np.zeros((bottom - top, right - left), dtype=bool)
+    reached[ys - top, xs - left] = True
+    allowed = np.zeros_like(reached)
+    allowed[max(1, top) - top:, max(1, left) - left:] = True
+    for step in range(radius):
+        grown = np.zeros_like(reached)
+        grown[1:] |= reached[:-1]
+        grown[:-1] |= reached[1:]
+        grown[:, 1:] |= reached[:, :-1]
+        grown[:, :-1] |= reached[:, 1:]
+        ring = grown & allowed & ~reached
+        yield left, top, ring
+        reached |= ring
 
 
 class AnnotatedRegion(GFFAnnotation):
@@ -323,16 +340,11 @@ class AnnotatedRegion(GFFAnnotation):
         self.protein_spans = []
 
     def cds_region_points(self):
-        exon_indices = set()
+        """The rows of self.points covered by any CDS, each only once"""
+        in_exon = np.zeros(len(self.points), dtype=bool)
         for exon in self.protein_spans:
-            exon_indices.update(exon.set_of_points())
-        length = len(self.points)
-        exon_points = []
-        for i in exon_indices:
-            adjusted = i - self.start
-            if 0 <= adjusted < length:
-                exon_points.append(self.points[adjusted])
-        return exon_points
+            in_exon[max(0, exon.begin - self.start): max(0, exon.end - self.start)] = True
+        return self.points[in_exon]
 
     def add_cds_region(self, annotation_entry):
         """ :type annotation_entry: GFFAnnotation """
@@ -14,7 +14,7 @@ try e.g. python3 Ideogram.py -x 3 3 3 -y 3 3 3
 import sys
 from itertools import chain
 
-from DNASkittleUtils.Contigs import read_contigs
+from FluentDNA.FastaIndex import read_indexed_contigs
 
 from FluentDNA.FluentDNAUtils import beep
 from FluentDNA.HighlightedAnnotation import HighlightedAnnotation
@@ -121,6 +121,14 @@ class IdeogramCoordinateFrame(LayoutFrame):
     def relative_position(self, progress):
         return self.point_mapping[progress]
 
+    def relative_positions(self, progress):
+        """Vectorized relative_position().  point_mapping is copied into an array the first time
+        after it grows."""
+        if getattr(self, 'mapping_array', None) is None or len(self.mapping_array) != len(self.point_mapping):
+            self.mapping_array = np.array(self.point_mapping, dtype=np.int64).reshape(-1, 2)
+        points = self.mapping_array[np.asarray(progress, dtype=np.int64)]
+        return points[..., 0], points[..., 1]
+
 
     def handle_multi_column_annotations(self, start, stop):
         """In 2D fractal layout, this method is much simpler since there's no columns per se.
@@ -200,7 +208,7 @@ class Ideogram(HighlightedAnnotation):
     def process_file(self, input_file_path, output_folder, output_file_name,
                      no_webpage=False, extract_contigs=None):
         if extract_contigs is None:
-            contigs = read_contigs(input_file_path)
+            contigs = read_indexed_contigs(input_file_path)
             extract_contigs = [contigs[0].name.split()[0]]
             print("Extracting ", extract_contigs)
 
@@ -1,6 +1,7 @@
 import sys
+import numpy as np
 from PIL import Image, ImageDraw
-from FluentDNA.FluentDNAUtils import multi_line_height
+from FluentDNA.FluentDNAUtils import multi_line_height, paste_on_canvas
 
 
 class LayoutLevel(object):
@@ -73,26 +74,60 @@ class LayoutFrame(list):
         return xy[0] + self.origin[0], xy[1] + self.origin[1]
 
 
+    def relative_positions(self, progress):
+        """Vectorized relative_position() for an array of nucleotide indices.
+        :return: x and y numpy arrays the same shape as progress"""
+        progress = np.asarray(progress, dtype=np.int64)
+        xy = [np.zeros(progress.shape, dtype=np.int64), np.zeros(progress.shape, dtype=np.int64)]
+        for i, level in enumerate(self.levels):
+            # levels that progress doesn't reach add 0, same as the early return above
+            xy[i % 2] += level.thickness * (progress // level.chunk_size % level.modulo)
+        return xy[0], xy[1]
+
+    def positions_on_screen(self, progress):
+        x, y = self.relative_positions(progress)
+        return x + self.origin[0], y + self.origin[1]
+
+    def progress_at(self, x, y):
+        """Inverse of positions_on_screen() for arrays of pixel coordinates.
+        :return: progress of each pixel, and the index of the level whose padding the pixel falls
+        in.  Pixels holding a nucleotide position have region -1 and pixels outside the frame
+        have region len(self.levels).  Progress is -1 wherever region isn't -1."""
+        relative = [axis.copy() for axis in np.broadcast_arrays(np.asarray(x, dtype=np.int64) - self.origin[0],
+                                                                np.asarray(y, dtype=np.int64) - self.origin[1])]
+        progress = np.zeros(relative[0].shape, dtype=np.int64)
+        region = np.full(relative[0].shape, -1, dtype=np.int64)
+        outside = (relative[0] < 0) | (relative[1] < 0)
+        for i in reversed(range(len(self.levels))):  # biggest level first, like reading digits
+            level, part = self.levels[i], i % 2
+            index = relative[part] // level.thickness
+            if i >= len(self.levels) - 2:  # the largest level in each direction doesn't repeat
+                outside |= index >= level.modulo
+            progress += index * level.chunk_size
+            relative[part] -= index * level.thickness
+            if i >= 2:  # the end of each unit is padding after its child levels in the same direction
+                child = self.levels[i - 2]
+                region[(region == -1) & (relative[part] >= child.modulo * child.thickness)] = i
+        region[outside] = len(self.levels)
+        progress[region != -1] = -1
+        return progress, region
+
+
     def handle_multi_column_annotations(coord_frame, start, stop):
         interval = abs(stop - start)
-        upper_left = coord_frame.position_on_screen(start + 2)
-        bottom_right = coord_frame.position_on_screen(stop - 2)
-        multi_column = abs(bottom_right[0] - upper_left[0]) > coord_frame.base_width
-        if True:  # multi_column:  # pick the biggest column to contain the label, ignore others
-            median_point = interval // 2 + min(start, stop)
-            s = median_point // coord_frame.base_width * coord_frame.base_width  # beginning of the line holding median
-            left = coord_frame.position_on_screen(s)[0]  # x coordinate of beginning of line
-            right = coord_frame.position_on_screen(s + coord_frame.base_width - 2)[0]  # end of one line
-            # top is the start or  top of the column
-            # bottom is the stop or bottom of the column
-            column_step = coord_frame.levels[2].chunk_size
-            top_of_column = median_point // column_step * column_step
-            top = max(start, top_of_column)
-            bottom = min(stop, top_of_column + column_step - 2)
-            top, bottom = coord_frame.position_on_screen(top)[1], coord_frame.position_on_screen(bottom)[1]
-            height = abs(bottom - top)
-        # else:
-        #     height = interval // coord_frame.base_width
+        median_point = interval // 2 + min(start, stop)
+        s = median_point // coord_frame.base_width * coord_frame.base_width  # beginning of the line holding median
+        # top is the start or  top of the column
+        # bottom is the stop or bottom of the column
+        column_step = coord_frame.levels[2].chunk_size
+        top_of_column = median_point // column_step * column_step
+        top = max(start, top_of_column)
+        bottom = min(stop, top_of_column + column_step - 2)
+        # pick the biggest column to contain the label, ignore others
+        xs, ys = coord_frame.positions_on_screen([s, s + coord_frame.base_width - 2, top, bottom])
+        left, right = int(xs[0]), int(xs[1])  # x coordinate of beginning and end of one line
+        top, bottom = int(ys[2]), int(ys[3])
+        height = abs(bottom - top)
         width = coord_frame.base_width
         return width, height, left, right, top, bottom
 
@@ -127,7 +162,7 @@ class LayoutFrame(list):
         if horizontal_centering:
             margin = width - text_width
             upper_left[0] += margin // 2
-        canvas.paste(txt, (upper_left[0], upper_left[1]), txt)
+        paste_on_canvas(canvas, txt, (upper_left[0], upper_left[1]), txt)
 
 
 
@@ -14,10 +14,11 @@ from FluentDNA.Layouts import level_layout_factory
 
 class ParallelLayout(TileLayout):
     def __init__(self, n_genomes, low_contrast=False, base_width=100, column_widths=None,
-                 border_boxes=False):
+                 border_boxes=False, indexed_color=False):
         # This layout is best used on one chromosome at a time.
         super(ParallelLayout, self).__init__(sort_contigs=False,
-                                             low_contrast=low_contrast, base_width=base_width)
+                                             low_contrast=low_contrast, base_width=base_width,
+                                             indexed_color=indexed_color)
         self.use_border_boxes = border_boxes
         self.header_height = 12 if border_boxes else 0
 
@@ -101,7 +102,7 @@ class ParallelLayout(TileLayout):
         To help keep track of it correctly, ParallelGenomeLayout demarcates bundles of columns that go
         together.  Mouse over gives further information on each file."""
         from DNASkittleUtils.DDVUtils import pp
-        from FluentDNA.FluentDNAUtils import execution_dir
+        from FluentDNA.FluentDNAUtils import execution_dir, paste_on_canvas
         base_dir = execution_dir()
         # Caution: These corners are currently hard coded to the color and dimension of one image
         try:
@@ -127,11 +128,11 @@ class ParallelLayout(TileLayout):
             last_column = self.each_layout[-1]
             right, bottom = last_column.position_on_screen(column_progress + column_size - 1)
             right, bottom = min(self.image.width, right + margin), min(self.image.height, bottom + margin//2)
-            self.draw.rectangle([left, top, right, bottom], fill=color)
-            self.image.paste(corner, (right -6, top))
-            self.image.paste(corner_rb, (right - 7, bottom - 6))
-            self.image.paste(corner_lb, (left , bottom - 7))
-            self.image.paste(corner_lt, (left, top))
+            self.draw.rectangle([left, top, right, bottom], fill=self.canvas_color(color))
+            paste_on_canvas(self.image, corner, (right -6, top))
+            paste_on_canvas(self.image, corner_rb, (right - 7, bottom - 6))
+            paste_on_canvas(self.image, corner_lb, (left , bottom - 7))
+            paste_on_canvas(self.image, corner_lt, (left, top))
             #TODO: could be optimized by caching the text image
             for i, layout in enumerate(self.each_layout):
                 left, ignore = layout.position_on_screen(column_progress)
@@ -181,5 +182,5 @@ class ParallelLayout(TileLayout):
         return reset_padding, title_padding, tail
 
 
-    def draw_title(self, total_progress, contig):
-        super(ParallelLayout, self).draw_title(total_progress, contig)
+    def draw_title(self, total_progress, contig, canvas_top=0):
+        super(ParallelLayout, self).draw_title(total_progress, contig, canvas_top)
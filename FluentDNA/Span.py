@@ -216,6 +216,170 @@ class AlignedSpans(object):
     #     return first, second
 
 
+class AlignmentList(object):
+    """Ordered list of AlignedSpans that replaces blist for ChainParser.alignment.  Items are kept in
+    short blocks so an insert or pop in the middle only shifts items inside one block (at most
+    2 * block_size) and a Fenwick tree of block lengths finds that block in O(log n).  Behaves like a
+    list for append, insert, pop, indexing and iteration, with lookups by ref and query coordinate on top."""
+    block_size = 1024
+
+    def __init__(self, items=()):
+        items = list(items)
+        self.blocks = [items[start: start + self.block_size]
+                       for start in range(0, len(items), self.block_size)] or [[]]
+        self.length = len(items)
+        self.rebuild_tree()
+
+    def rebuild_tree(self):
+        """Recounts the tree after blocks are added or removed, in O(number of blocks)"""
+        tree = [0] + [len(block) for block in self.blocks]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.top_step = 1
+        while self.top_step * 2 < len(tree):
+            self.top_step *= 2
+
+    def add_to_tree(self, block_index, change):
+        tree, i = self.tree, block_index + 1
+        while i < len(tree):
+            tree[i] += change
+            i += i & -i
+
+    def check_block(self, block_index):
+        """Splits a block that has grown too long and drops one that is empty"""
+        block = self.blocks[block_index]
+        if len(block) > 2 * self.block_size:
+            half = len(block) // 2
+            self.blocks[block_index: block_index + 1] = [block[:half], block[half:]]
+            self.rebuild_tree()
+        elif not block and len(self.blocks) > 1:
+            del self.blocks[block_index]
+            self.rebuild_tree()
+
+    def locate(self, index):
+        """(block index, index inside block) of a list index"""
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("alignment index out of range")
+        tree, block, step = self.tree, 0, self.top_step
+        while step:  # walk down the tree to the last block starting at or before index
+            if block + step < len(tree) and tree[block + step] <= index:
+                block += step
+                index -= tree[block]
+            step //= 2
+        return block, index
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for block in self.blocks:
+            for item in block:
+                yield item
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        block, offset = self.locate(index)
+        return self.blocks[block][offset]
+
+    def append(self, item):
+        if len(self.blocks[-1]) >= self.block_size:
+            self.blocks.append([item])
+            self.length += 1
+            self.rebuild_tree()
+        else:
+            self.blocks[-1].append(item)
+            self.length += 1
+            self.add_to_tree(len(self.blocks) - 1, 1)
+
+    def insert(self, index, item):
+        if index < 0:
+            index = max(0, index + self.length)
+        if index >= self.length:
+            return self.append(item)
+        block, offset = self.locate(index)
+        self.blocks[block].insert(offset, item)
+        self.length += 1
+        self.add_to_tree(block, 1)
+        self.check_block(block)
+
+    def pop(self, index=-1):
+        if not self.length:
+            raise IndexError("pop from empty alignment")
+        block, offset = self.locate(index)
+        item = self.blocks[block].pop(offset)
+        self.length -= 1
+        self.add_to_tree(block, -1)
+        self.check_block(block)
+        return item
+
+    def replace(self, index, items):
+        """Puts items in place of the one at index, like list[index:index + 1] = items"""
+        block, offset = self.locate(index)
+        self.blocks[block][offset: offset + 1] = items
+        self.length += len(items) - 1
+        self.add_to_tree(block, len(items) - 1)
+        self.check_block(block)
+
+    def bisect_ref(self, new_alignment):
+        """Same answer as alignment_chopping_index() on a list: the first index whose ref doesn't
+        begin before new_alignment.  Assumes the items are sorted by ref begin."""
+        lo, hi = 0, len(self.blocks)
+        while lo < hi:  # first block whose last item isn't before new_alignment
+            mid = (lo + hi) // 2
+            if self.blocks[mid] and self.blocks[mid][-1] < new_alignment:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == len(self.blocks):
+            return self.length
+        index, block = self.items_before(lo), self.blocks[lo]
+        lo, hi = 0, len(block)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if block[mid] < new_alignment:
+                lo = mid + 1
+            else:
+                hi = mid
+        return index + lo
+
+    def items_before(self, block_index):
+        total, i = 0, block_index
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def master_query_index(self, new_alignment):
+        """Index of the last master chain entry whose query begins at or before new_alignment's query.
+        Translocations are inserted between master entries, so they're stepped over.  None if there's no such entry."""
+        def first_master(block):
+            return next((item for item in block if item.is_master_chain), None)
+
+        lo, hi = 0, len(self.blocks)
+        while lo < hi:  # first block whose first master entry is past new_alignment
+            mid = (lo + hi) // 2
+            probe = mid
+            while probe < hi and first_master(self.blocks[probe]) is None:
+                probe += 1
+            if probe == hi or new_alignment.query_less_than(first_master(self.blocks[probe])):
+                hi = mid
+            else:
+                lo = probe + 1
+        for block_index in range(lo - 1, -1, -1):
+            block = self.blocks[block_index]
+            for offset in range(len(block) - 1, -1, -1):
+                item = block[offset]
+                if item.is_master_chain and not new_alignment.query_less_than(item):
+                    return self.items_before(block_index) + offset
+        return None
+
+
 def alignment_chopping_index(all_alignments, new_alignment):
     """Return the index where to insert item x in list a, assuming a is sorted.
 
@@ -226,6 +390,8 @@ def alignment_chopping_index(all_alignments, new_alignment):
     Optional args lo (default 0) and hi (default len(a)) bound the
     slice of a to be searched.
     """
+    if isinstance(all_alignments, AlignmentList):
+        return all_alignments.bisect_ref(new_alignment)
     lo = 0
     hi = len(all_alignments)
 
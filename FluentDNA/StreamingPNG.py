@@ -0,0 +1,61 @@
+from __future__ import print_function, division, absolute_import, \
+    with_statement, generators, nested_scopes
+
+import struct
+import zlib
+
+import numpy as np
+
+
+class StreamingPNG(object):
+    """Writes a PNG file one horizontal band at a time.  PIL can only save an Image that is
+    completely in memory, which for whole genomes is many GB.  Here each band of rows is
+    compressed and appended to the IDAT stream as soon as it is drawn.
+    Usage:
+        png = StreamingPNG(path, width, height, 'RGB')
+        for band in bands:
+            png.append(np.asarray(band))  # rows from top to bottom
+        png.close()
+    """
+    color_types = {'L': (0, 1), 'RGB': (2, 3), 'P': (3, 1), 'RGBA': (6, 4)}  # mode: (color type, channels)
+
+    def __init__(self, path, width, height, mode='RGB', palette=None, compression_level=6):
+        if mode not in self.color_types:
+            raise ValueError("Streaming PNG does not support image mode %s" % mode)
+        color_type, self.channels = self.color_types[mode]
+        self.width, self.height = width, height
+        self.rows_written = 0
+        self.compressor = zlib.compressobj(compression_level)
+        self.file = open(path, 'wb')
+        self.file.write(b'\x89PNG\r\n\x1a\n')
+        # 8 bits per channel, default compression, filter method and no interlacing
+        self.write_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0))
+        if mode == 'P':
+            self.write_chunk(b'PLTE', bytes(bytearray(palette[:256 * 3])))
+
+    def append(self, rows):
+        """Add the next rows of the image.  rows is a uint8 array shaped (height, width) or
+        (height, width, channels) like np.asarray(PIL.Image)"""
+        rows = np.asarray(rows, dtype=np.uint8)
+        rows = rows.reshape(rows.shape[0], -1)
+        if rows.shape[1] != self.width * self.channels:
+            raise ValueError("Band is %i bytes wide, expected %i" % (rows.shape[1], self.width * self.channels))
+        if self.rows_written + rows.shape[0] > self.height:
+            raise ValueError("More rows than the %i pixel height of the image" % self.height)
+        scanlines = np.zeros((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+        scanlines[:, 1:] = rows  # first byte of each scanline is filter type 0: None
+        self.write_chunk(b'IDAT', self.compressor.compress(scanlines.tobytes()))
+        self.rows_written += rows.shape[0]
+
+    def close(self):
+        self.write_chunk(b'IDAT', self.compressor.flush())
+        self.write_chunk(b'IEND', b'')
+        self.file.close()
+        if self.rows_written != self.height:
+            print("Warning: PNG is %i pixels tall but only %i rows were written" % (self.height, self.rows_written))
+
+    def write_chunk(self, chunk_type, data):
+        if not data and chunk_type == b'IDAT':
+            return  # zlib is still buffering
+        self.file.write(struct.pack('>I', len(data)) + chunk_type + data +
+                        struct.pack('>I', zlib.crc32(chunk_type + data) & 0xffffffff))
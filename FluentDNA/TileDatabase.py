@@ -0,0 +1,86 @@
+from __future__ import print_function, division, absolute_import, \
+    with_statement, generators, nested_scopes
+
+import os
+import re
+import sqlite3
+
+try:
+    from http import server
+except ImportError:  # Python 2 imports
+    import SimpleHTTPServer as server
+
+
+class TileDatabase(object):
+    """Every tile of a Deep Zoom image in one SQLite file instead of a folder per level full of
+    small files.  The layout follows the de-duplicated MBTiles schema: 'images' stores each distinct
+    tile once and 'map' points each level, column and row at one of them.  Rows are numbered
+    from the top like Deep Zoom, not flipped like MBTiles."""
+    def __init__(self, path, overwrite=False):
+        self.path = path
+        if overwrite and os.path.exists(path):
+            os.remove(path)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS images (tile_id TEXT PRIMARY KEY, tile_data BLOB);
+            CREATE TABLE IF NOT EXISTS map (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER,
+                                            tile_id TEXT, PRIMARY KEY (zoom_level, tile_column, tile_row));
+            CREATE VIEW IF NOT EXISTS tiles AS
+                SELECT zoom_level, tile_column, tile_row, tile_data FROM map JOIN images USING (tile_id);
+        """)
+
+    def set_metadata(self, **values):
+        self.connection.executemany("INSERT OR REPLACE INTO metadata VALUES (?, ?)",
+                                    [(name, str(value)) for name, value in values.items()])
+
+    def add_image(self, tile_id, data):
+        self.connection.execute("INSERT OR IGNORE INTO images VALUES (?, ?)", (tile_id, sqlite3.Binary(data)))
+
+    def add_tile(self, level, column, row, tile_id):
+        self.connection.execute("INSERT OR REPLACE INTO map VALUES (?, ?, ?, ?)", (level, column, row, tile_id))
+
+    def get_tile(self, level, column, row):
+        """Encoded image bytes of the tile or None"""
+        found = self.connection.execute("SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? "
+                                        "AND tile_row=?", (level, column, row)).fetchone()
+        return bytes(found[0]) if found else None
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+
+tile_path_pattern = re.compile(r'(.*)_files[/\\](\d+)[/\\](\d+)_(\d+)\.(png|jpg)$')
+open_containers = {}  # database path: (TileDatabase, inode), kept open by the server
+
+
+def tile_from_container(file_path):
+    """Looks up a Deep Zoom tile path like GeneratedImages/dzc_output_files/12/3_4.png in
+    GeneratedImages/dzc_output.db.  Returns (bytes, format) or None if there's no such tile."""
+    match = tile_path_pattern.match(file_path)
+    if not match:
+        return None
+    database_path = match.group(1) + '.db'
+    if not os.path.exists(database_path):
+        return None
+    version = os.stat(database_path).st_ino  # a new render replaces the file
+    if database_path not in open_containers or open_containers[database_path][1] != version:
+        open_containers[database_path] = (TileDatabase(database_path), version)
+    level, column, row = (int(match.group(i)) for i in (2, 3, 4))
+    data = open_containers[database_path][0].get_tile(level, column, row)
+    return (data, match.group(5)) if data is not None else None
+
+
+class TileContainerHandler(server.SimpleHTTPRequestHandler):
+    """Serves Deep Zoom tiles from a --tile_container database when there is one"""
+    def do_GET(self):
+        tile = tile_from_container(self.translate_path(self.path))
+        if tile is None:
+            return server.SimpleHTTPRequestHandler.do_GET(self)
+        data, tile_format = tile
+        self.send_response(200)
+        self.send_header("Content-type", "image/png" if tile_format == 'png' else "image/jpeg")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
@@ -2,23 +2,41 @@ from __future__ import print_function, division, absolute_import, \
     with_statement, generators, nested_scopes
 
 import math
+import multiprocessing
 import os
 import traceback
-from collections import defaultdict
+from collections import defaultdict, OrderedDict, deque
 from datetime import datetime
 
 import sys
-from DNASkittleUtils.Contigs import read_contigs, Contig, write_contigs_to_file
+from bisect import bisect_right
+import numpy as np
+from DNASkittleUtils.Contigs import Contig, write_contigs_to_file
 from DNASkittleUtils.DDVUtils import copytree
 from PIL import Image, ImageDraw, ImageFont
 
 from FluentDNA import gap_char
 from FluentDNA.FluentDNAUtils import multi_line_height, pretty_contig_name, viridis_palette, \
-    make_output_directory, filter_by_contigs, copy_to_sources
+    make_output_directory, filter_by_contigs, copy_to_sources, paste_on_canvas, linspace, missing_color, \
+    nearest_palette_indices
 from FluentDNA.Layouts import LayoutFrame, LayoutLevel, level_layout_factory, parse_custom_layout
+from FluentDNA.FastaIndex import read_indexed_contigs, indexed_records, scan_contig_lengths, \
+    SequenceLength
+from FluentDNA.StreamingPNG import StreamingPNG
+from FluentDNA.deepzoom import StreamingImageCreator
 
 small_title_bp = 10000
 protein_found_message = False
+band_layout = None  # copy of the TileLayout in each draw_bands() worker process
+
+
+def init_band_worker(layout):
+    global band_layout
+    band_layout = layout
+
+
+def render_band_in_worker(job):
+    return band_layout.render_band(*job)
 
 
 
@@ -27,6 +45,14 @@ def hex_to_rgb(h):
     return tuple(int(h[i:i+2], 16) for i in (0, 2 ,4))
 
 
+def sequence_to_array(seq):
+    """One uint8 per character, ready to be used as an index into a palette lookup table"""
+    if isinstance(seq, (bytes, bytearray)):
+        return np.frombuffer(seq, dtype=np.uint8)
+    # non-latin characters don't have a palette entry either way, '?' will also be default red
+    return np.frombuffer(seq.encode('latin-1', 'replace'), dtype=np.uint8)
+
+
 def is_protein_sequence(contig):
     """Checks if there are any peptide characters in the first 100 of the first contig"""
     global protein_found_message
@@ -41,7 +67,8 @@ def is_protein_sequence(contig):
 class TileLayout(object):
     def __init__(self, use_titles=True, sort_contigs=False,
                  low_contrast=False, base_width=100, border_width=3,
-                 custom_layout=None):
+                 custom_layout=None, indexed_color=False, streaming=False, direct_tiles=False,
+                 workers=1, tile_container=False):
         self.fasta_sources = []  # to be added in output_fasta for each file
         self.use_titles = use_titles
         self.skip_small_titles = False
@@ -51,16 +78,19 @@ class TileLayout(object):
         self.low_contrast = low_contrast
         self.title_skip_padding = base_width  # skip one line. USER: Change this
 
-        # precomputing fonts turns out to be a big performance gain
-        sizes = [9, 38, 380, 380 * 2]
         self.fonts = {}
-        self.fonts = {size: self.get_font(size) for size in sizes}
-        self.fonts[sizes[0]] = ImageFont.load_default()  # looks better at low res
+        self.load_fonts()
         self.final_output_location = None
         self.image = None
         self.draw = None
         self.pixels = None
         self.pil_mode = 'RGB'  # no alpha channel means less RAM used
+        self.indexed_color = indexed_color  # 1 byte per pixel 'P' mode image instead of pil_mode
+        self.streaming = streaming  # draw and save one mega row at a time instead of the whole image
+        self.direct_tiles = direct_tiles  # draw Deep Zoom tiles from the sequence, no full size image
+        self.workers = workers  # processes for drawing mega rows and encoding tiles
+        self.tile_container = tile_container  # Deep Zoom tiles in one .db file
+        self.image_dimensions = (1, 1)  # remembered for the webpage when self.image is not kept
         self.contigs = []
         self.contig_memory = []
         self.image_length = 0
@@ -81,7 +111,7 @@ class TileLayout(object):
         self.megarow_label_size = self.levels[3].chunk_size
 
         #Natural, color blind safe Colors
-        self.palette = defaultdict(lambda: (255, 0, 0))  # default red will stand out
+        self.palette = defaultdict(missing_color)  # default red will stand out
 
         #### Rasmol Protein colors
         self.palette['D'] = hex_to_rgb('EA3535')
@@ -119,6 +149,16 @@ class TileLayout(object):
         self.palette['Z'] = hex_to_rgb('#F9EDFF')  #F8E5FF pink
         self.palette['U'] = hex_to_rgb('#FFF3E5')  #FFF3E5 orange
 
+    def __getstate__(self):
+        """Copy sent to worker processes.  The canvas stays behind and fonts are loaded again."""
+        state = self.__dict__.copy()
+        state.update(image=None, draw=None, pixels=None, fonts={})
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.load_fonts()
+
     @property
     def levels(self):
         return self.each_layout[self.i_layout]
@@ -176,22 +216,37 @@ class TileLayout(object):
         self.final_output_location = output_folder
         self.image_length = self.read_contigs_and_calc_padding(input_file_path, extract_contigs)
         print("Read contigs from", input_file_path, ":", datetime.now() - start_time)
+        if self.streaming or self.direct_tiles:
+            self.stream_image(output_folder, output_file_name, no_webpage)
+            print("Streamed Image in:", datetime.now() - start_time)
+            self.output_fasta(output_folder, input_file_path, no_webpage,
+                              extract_contigs, self.sort_contigs)
+            print("Output Fasta in:", datetime.now() - start_time)
+            return start_time
         self.prepare_image(self.image_length)
         print("Initialized Image:", datetime.now() - start_time, "\n")
-        try:  # These try catch statements ensure we get at least some output.  These jobs can take hours
-            self.draw_nucleotides()
-            print("\nDrew Nucleotides:", datetime.now() - start_time)
-        except Exception as e:
-            print('Encountered exception while drawing nucleotides:', '\n')
-            traceback.print_exc()
-        try:
-            if self.use_titles:
-                print("Drawing %i titles" % sum(len(x.seq) > small_title_bp for x in self.contigs))
-                self.draw_titles()
-                print("Drew Titles:", datetime.now() - start_time)
-        except BaseException as e:
-            print('Encountered exception while drawing titles:', '\n')
-            traceback.print_exc()
+        if self.workers > 1:
+            try:
+                self.draw_megarows()
+                print("\nDrew Nucleotides and Titles:", datetime.now() - start_time)
+            except Exception as e:
+                print('Encountered exception while drawing mega rows:', '\n')
+                traceback.print_exc()
+        else:
+            try:  # These try catch statements ensure we get at least some output.  These jobs can take hours
+                self.draw_nucleotides()
+                print("\nDrew Nucleotides:", datetime.now() - start_time)
+            except Exception as e:
+                print('Encountered exception while drawing nucleotides:', '\n')
+                traceback.print_exc()
+            try:
+                if self.use_titles:
+                    print("Drawing %i titles" % sum(len(x.seq) > small_title_bp for x in self.contigs))
+                    self.draw_titles()
+                    print("Drew Titles:", datetime.now() - start_time)
+            except BaseException as e:
+                print('Encountered exception while drawing titles:', '\n')
+                traceback.print_exc()
         try:
             self.draw_extras()
         except BaseException as e:
@@ -212,28 +267,103 @@ class TileLayout(object):
 
     def draw_nucleotides(self, verbose=True):
         total_progress = 0
+        self.palette_lookup = self.palette_lookup_table()  # palette can change between genomes
         # Layout contigs one at a time
         for contig_index, contig in enumerate(self.contigs):
             total_progress += contig.reset_padding + contig.title_padding
-            seq_length = len(contig.seq)
-            line_width = self.levels[0].modulo
-            for cx in range(0, seq_length, line_width):
-                x, y = self.position_on_screen(total_progress)
-                remaining = min(line_width, seq_length - cx)
-                total_progress += remaining
-                try:
-                    for i in range(remaining):
-                        nuc = contig.seq[cx + i]
-                        # if nuc != gap_char:
-                        self.draw_pixel(nuc, x + i, y)
-                except IndexError:
-                   print("Cursor fell off the image at", (x,y))
+            self.draw_sequence(contig.seq, total_progress)
+            total_progress += len(contig.seq)
             total_progress += contig.tail_padding  # add trailing white space after the contig sequence body
             if verbose and (len(self.contigs) < 100 or contig_index % (len(self.contigs) // 100) == 0):
                 print(str(total_progress / self.image_length * 100)[:4], '% done:', contig.name,
                       flush=True)  # pseudo progress bar
 
 
+    def draw_sequence(self, seq, total_progress):
+        """Draws one contig starting at total_progress.  Whenever the cursor is at the start of a line,
+        every remaining line in that column is copied as a single block.  For the standard layout this
+        means one block per 100,000bp column instead of one Python call per nucleotide."""
+        for cx, n_lines, width, x, y in self.sequence_blocks(len(seq), total_progress):
+            nucleotides = sequence_to_array(seq[cx: cx + n_lines * width])  # only this block is read
+            self.draw_block(nucleotides.reshape(n_lines, width), x, y)
+
+
+    def sequence_blocks(self, seq_length, total_progress):
+        """Splits a contig into rectangles of whole lines, or a single partial line.
+        Yields (index in contig, number of lines, line width, x, y) for each block."""
+        line_width = self.levels[0].modulo
+        column_size = line_width * self.levels[1].modulo
+        if seq_length <= 0:
+            return
+        end = total_progress + seq_length
+        # a partial line to reach the start of a line, whole lines up to each column break, then the rest
+        lines_start = min(end, -(-total_progress // line_width) * line_width)
+        lines_end = max(lines_start, end // line_width * line_width)
+        first_break = -(-(lines_start + 1) // column_size) * column_size
+        starts = [total_progress] if total_progress < lines_start else []
+        starts = np.concatenate([starts, [lines_start] if lines_start < lines_end else [],
+                                 np.arange(first_break, lines_end, column_size),
+                                 [lines_end] if lines_end < end else []]).astype(np.int64)
+        stops = np.append(starts[1:], end)
+        xs, ys = self.positions_on_screen(starts)
+        for start, stop, x, y in zip(starts.tolist(), stops.tolist(), xs.tolist(), ys.tolist()):
+            if start % line_width == 0 and stop - start >= line_width:
+                yield start - total_progress, (stop - start) // line_width, line_width, x, y
+            else:  # partial line
+                yield start - total_progress, 1, stop - start, x, y
+
+
+    def draw_block(self, block, x, y):
+        """Colors a 2D array of sequence bytes and pastes it with the upper left corner at x, y"""
+        height, width = block.shape
+        if x + width > self.image.width or y + height > self.image.height:
+            print("Cursor fell off the image at", (x, y))
+            block = block[:max(0, self.image.height - y), :max(0, self.image.width - x)]
+            if not block.size:
+                return
+        colors = self.palette_lookup[block]
+        if self.image.mode == 'P':  # same mode paste copies the palette indices as they are
+            block_image = Image.frombytes('P', (colors.shape[1], colors.shape[0]), colors.tobytes())
+        else:
+            block_image = Image.fromarray(colors, 'RGB')
+        self.image.paste(block_image, (x, y))
+
+
+    def palette_lookup_table(self):
+        """Converts self.palette into a 256 x RGB array indexed by the byte value of each character.
+        Characters that aren't in the palette get the palette's default color."""
+        default_color = self.palette.default_factory()
+        table = np.empty((256, 3), dtype=np.uint8)
+        for byte in range(256):
+            key = byte if self.using_spectrum else chr(byte)  # spectrum palettes are keyed on byte value
+            table[byte] = self.palette[key] if key in self.palette else default_color
+        if self.image is not None and self.image.mode == 'P':
+            table = nearest_palette_indices(table, self.image.getpalette())
+        return table
+
+
+    def canvas_color(self, rgb):
+        """Fill value for ImageDraw calls.  Indexed color images need a palette index instead of RGB."""
+        if self.image.mode == 'P':
+            return int(nearest_palette_indices(np.array([rgb]), self.image.getpalette())[0])
+        return rgb
+
+
+    def indexed_palette(self):
+        """Palette for an indexed color image: white background, every color that either nucleotide
+        color scheme or the protein colors can use, then greys for anti-aliased title text
+        in all the remaining slots.  Returns a flat list of 256 RGB values for Image.putpalette()."""
+        current_colors = dict(self.palette)
+        colors = [hex_to_rgb('#FFFFFF'), self.palette.default_factory()]
+        for color_scheme in [self.activate_high_contrast_colors, self.activate_natural_colors]:
+            color_scheme()  # ParallelLayout switches color schemes between genomes
+            colors.extend(self.palette.values())
+        self.palette.update(current_colors)
+        colors = list(OrderedDict.fromkeys(colors))  # remove duplicates
+        colors.extend([(int(v),) * 3 for v in linspace(0, 255, 256 - len(colors))])
+        return [value for color in colors for value in color]
+
+
     def output_fasta(self, output_folder, fasta, no_webpage, extract_contigs, sort_contigs,
                      append_fasta_sources=True, create_source_download=True):
         bare_file = os.path.basename(fasta)
@@ -249,7 +379,9 @@ class TileLayout(object):
                 if extract_contigs or sort_contigs:  # customized_fasta
                     length_sum = sum([len(c.seq) for c in self.contigs])
                     fasta_destination = '%s__%ibp.fa' % (os.path.splitext(fasta_destination)[0], length_sum)
-                    write_contigs_to_file(fasta_destination, self.contigs)  # shortened fasta
+                    # shortened fasta, one read per contig when seq is a SequenceView
+                    write_contigs_to_file(fasta_destination, (Contig(c.name, str(c.seq)) for c in self.contigs),
+                                          verbose=False)
                 else:
                     copy_to_sources(output_folder, fasta)
                 print("Sequence saved in:", fasta_destination)
@@ -287,7 +419,7 @@ class TileLayout(object):
 
     def read_contigs_and_calc_padding(self, input_file_path, extract_contigs=None):
         try:
-            self.contigs = read_contigs(input_file_path)
+            self.contigs = read_indexed_contigs(input_file_path)
         except UnicodeDecodeError as e:
             print(e)
             print("Important: Non-standard characters detected.  Switching to 256 colormap for bytes")
@@ -298,14 +430,199 @@ class TileLayout(object):
         self.protein_palette = is_protein_sequence(self.contigs[0])
         return self.calc_all_padding()
 
+    def plan_layout(self, input_file_path, extract_contigs=None):
+        """Computes the whole layout from contig names and lengths alone, without reading any
+        sequence, so the size of a render can be checked before committing to it.
+        :return: dict of image dimensions, estimated memory and the contig_struct() records"""
+        sequence_in_memory = 0
+        try:
+            records = indexed_records(input_file_path)
+            if records is not None:
+                lengths = [(record.name, record.length) for record in records]
+            else:
+                lengths = scan_contig_lengths(input_file_path)
+                sequence_in_memory = sum(length for name, length in lengths)  # read_contigs() holds it all
+        except UnicodeDecodeError:
+            self.using_spectrum = True  # read_contigs_and_calc_padding() would read the raw bytes
+            lengths = [(input_file_path, os.path.getsize(input_file_path))]
+            sequence_in_memory = lengths[0][1]
+        self.contigs = [Contig(name, SequenceLength(length)) for name, length in lengths]
+        self.contigs = filter_by_contigs(self.contigs, extract_contigs)
+        self.image_length = self.calc_all_padding()
+        width, height = self.max_dimensions(self.image_length)
+        image_bytes = self.estimate_image_memory(width, height)
+        return {'width': width, 'height': height, 'image_length': self.image_length,
+                'contig_count': len(self.contigs), 'sequence_length': sum(len(c.seq) for c in self.contigs),
+                'megarows': self.levels[3].modulo, 'image_memory': image_bytes,
+                'sequence_memory': sequence_in_memory, 'contigs': self.contig_struct()}
+
+    def estimate_image_memory(self, width, height):
+        """Rough peak bytes of pixels held at once while rendering with the current settings."""
+        indexed = self.indexed_color and self.pil_mode == 'RGB' and not self.using_spectrum
+        pixel_bytes = 1 if indexed else Image.getmodebands(self.pil_mode)
+        if self.direct_tiles:  # one 256 row band, plus a pair of rows per zoom level and the queued tiles
+            return width * 256 * pixel_bytes * (2 + 2 * self.workers)
+        if self.streaming:
+            return width * max(bottom - top for top, bottom in self.megarow_bands(height)) * pixel_bytes
+        # create_deepzoom_stack() opens the saved image again and halves it level by level
+        return int(width * height * pixel_bytes * 2.25)
+
     def prepare_image(self, image_length):
         width, height = self.max_dimensions(image_length)
         print("Image dimensions are", width, "x", height, "pixels")
-        self.image = Image.new(self.pil_mode, (width, height), hex_to_rgb('#FFFFFF'))#ui_grey)
+        self.image_dimensions = (width, height)
+        self.image = self.new_canvas(width, height)
         self.draw = ImageDraw.Draw(self.image)
         self.pixels = self.image.load()
 
 
+    def new_canvas(self, width, height):
+        """Blank white image in the mode used for drawing: pil_mode or indexed color"""
+        if self.indexed_color and (self.pil_mode != 'RGB' or self.using_spectrum):
+            print("Indexed color is not available for this layout or palette.  Using", self.pil_mode)
+            self.indexed_color = False
+        if self.indexed_color:
+            canvas = Image.new('P', (width, height), 0)  # index 0 is white
+            canvas.putpalette(self.indexed_palette())
+        else:
+            canvas = Image.new(self.pil_mode, (width, height), hex_to_rgb('#FFFFFF'))#ui_grey)
+        return canvas
+
+
+    def stream_image(self, output_folder, output_file_name, no_webpage):
+        """Replaces prepare_image(), draw_nucleotides(), draw_titles() and output_image() for very
+        large genomes.  The image is drawn one band at a time and each band is handed to the PNG
+        writer (streaming) and/or the Deep Zoom tile writer (direct_tiles) as soon as it's done,
+        so memory use is one band instead of the whole image.
+        draw_extras() is not called, so this is only for the plain TileLayout."""
+        width, height = self.max_dimensions(self.image_length)
+        print("Image dimensions are", width, "x", height, "pixels")
+        self.image_dimensions = (width, height)
+        self.image = self.new_canvas(1, 1)  # canvas mode and palette for the writers
+        self.palette_lookup = self.palette_lookup_table()
+        writers = []
+        try:
+            if self.streaming:
+                self.final_output_location = self.image_output_path(output_folder, output_file_name, no_webpage)
+                print("-- Streaming:", self.final_output_location, "--")
+                writers.append(StreamingPNG(self.final_output_location, width, height,
+                                            self.image.mode, self.image.getpalette()))
+            if self.direct_tiles:
+                tile_size = 256  # same settings as create_deepzoom_stack()
+                dzi_location = os.path.join(output_folder, 'GeneratedImages', "dzc_output.xml")
+                if not self.streaming:
+                    self.final_output_location = dzi_location
+                print("-- Drawing Deep Zoom tiles:", dzi_location, "--")
+                writers.append(StreamingImageCreator(width, height, dzi_location, tile_size=tile_size,
+                                                     tile_overlap=1, tile_format="png", workers=self.workers,
+                                                     tile_container=self.tile_container))
+                bands = [(top, min(height, top + tile_size)) for top in range(0, height, tile_size)]
+            else:
+                bands = self.megarow_bands(height)
+            for band_index, (top, bottom) in enumerate(self.draw_bands(bands, width)):
+                for writer in writers:
+                    writer.append(self.image)
+                if band_index % max(1, len(bands) // 100) == 0 or bottom == height:
+                    print(str(bottom / height * 100)[:4], '% done: row', bottom, 'of', height,
+                          flush=True)  # pseudo progress bar
+        finally:
+            for writer in writers:
+                writer.close()
+            self.image = None
+
+
+    def draw_bands(self, bands, width):
+        """Draws each (top, bottom) band of rows in turn as self.image, with the rows of
+        nucleotides and titles that fall inside it.  Yields (top, bottom) when a band is done.
+        With more than one worker the bands are drawn by a process pool, still yielded in order."""
+        blocks = self.blocks_by_band(bands)
+        contig_indices = {id(contig): i for i, contig in enumerate(self.contigs)}
+        titles = [(total_progress, contig_indices[id(contig)], title_top, title_bottom)
+                  for total_progress, contig, title_top, title_bottom in self.title_placements()] \
+            if self.use_titles else []
+        jobs = ((width, top, bottom, blocks[band_index],
+                 [title for title in titles if title[2] < bottom and title[3] > top],
+                 band_index == len(bands) - 1) for band_index, (top, bottom) in enumerate(bands))
+        if self.workers <= 1:
+            for job in jobs:
+                self.image = self.render_band(*job)
+                yield job[1], job[2]
+            return
+        pool = multiprocessing.Pool(self.workers, initializer=init_band_worker, initargs=(self,))
+        try:
+            pending = deque()  # a few bands ahead of the writers so finished bands don't pile up
+            for job in jobs:
+                pending.append((job[1], job[2], pool.apply_async(render_band_in_worker, (job,))))
+                while len(pending) > 2 * self.workers or (pending and pending[0][2].ready()):
+                    top, bottom, band = pending.popleft()
+                    self.image = band.get()
+                    yield top, bottom
+            while pending:
+                top, bottom, band = pending.popleft()
+                self.image = band.get()
+                yield top, bottom
+        finally:
+            pool.terminate()
+            pool.join()
+
+
+    def render_band(self, width, top, bottom, blocks, titles, last_band):
+        """One band from draw_bands(): a new canvas with its blocks and
+        titles (total_progress, contig index, top, bottom) drawn on it"""
+        self.image = self.new_canvas(width, bottom - top)
+        self.draw_band(blocks, top, bottom, last_band)
+        for total_progress, contig_index, title_top, title_bottom in titles:
+            self.draw_title(total_progress, self.contigs[contig_index], canvas_top=top)
+        return self.image
+
+
+    def draw_megarows(self):
+        """draw_nucleotides() and draw_titles() one mega row at a time on the worker pool.
+        Each finished band is pasted into self.image."""
+        canvas = self.image
+        self.palette_lookup = self.palette_lookup_table()
+        for top, bottom in self.draw_bands(self.megarow_bands(canvas.height), canvas.width):
+            canvas.paste(self.image, (0, top))
+        self.image = canvas
+
+
+    def megarow_bands(self, height):
+        """(top, bottom) pixel rows of each mega row.  The first band includes the top margin
+        and the last band runs to the bottom of the image."""
+        band_height = self.levels[3].thickness
+        tops = list(range(self.levels.origin[1] + band_height, height, band_height))
+        return list(zip([0] + tops, tops + [height]))
+
+
+    def blocks_by_band(self, bands):
+        """Sorts every block from sequence_blocks() into the bands it overlaps.  Only positions
+        are stored here, the sequence itself is sliced out when the band is drawn."""
+        tops = [top for top, bottom in bands]
+        band_blocks = [[] for _ in bands]
+        total_progress = 0
+        for contig_index, contig in enumerate(self.contigs):
+            total_progress += contig.reset_padding + contig.title_padding
+            for block in self.sequence_blocks(len(contig.seq), total_progress):
+                cx, n_lines, width, x, y = block
+                first_band = max(0, bisect_right(tops, y) - 1)
+                last_band = max(0, bisect_right(tops, y + n_lines - 1) - 1)
+                for band_index in range(first_band, last_band + 1):
+                    band_blocks[band_index].append((contig_index,) + block)
+            total_progress += len(contig.seq) + contig.tail_padding
+        return band_blocks
+
+
+    def draw_band(self, blocks, top, bottom, last_band=False):
+        """Draws the rows of each block that fall between top and bottom onto self.image.
+        Rows past the end of the image are left in the last band so draw_block() reports them."""
+        for contig_index, cx, n_lines, width, x, y in blocks:
+            first_row = max(top, y)
+            end_row = y + n_lines if last_band else min(bottom, y + n_lines)
+            start, stop = cx + (first_row - y) * width, cx + (end_row - y) * width
+            nucleotides = sequence_to_array(self.contigs[contig_index].seq[start:stop])
+            self.draw_block(nucleotides.reshape(-1, width), x, first_row - top)
+
+
     def calc_padding(self, total_progress, next_segment_length):
         min_gap = (20 + 6) * self.base_width  # 20px font height, + 6px vertical padding  * 100 nt per line
 
@@ -352,21 +669,36 @@ class TileLayout(object):
     def position_on_screen(self, progress):  #Alias for layout: Optimize?
         return self.levels.position_on_screen(progress)
 
+    def positions_on_screen(self, progress):
+        """x and y arrays for an array of progress indices"""
+        return self.levels.positions_on_screen(progress)
+
 
     def draw_pixel(self, character, x, y):
         self.pixels[x, y] = self.palette[character]
 
 
     def draw_titles(self):
+        for total_progress, contig, top, bottom in self.title_placements():
+            self.draw_title(total_progress, contig)
+
+
+    def title_placements(self):
+        """(total_progress, contig, top row, bottom row) for each title that will be drawn"""
+        placements = []
         total_progress = 0
         for contig in self.contigs:
             total_progress += contig.reset_padding  # is to move the cursor to the right line for a large title
             if contig.title_padding > self.title_skip_padding:  # there needs to be room to draw
-                self.draw_title(total_progress, contig)
+                top = self.position_on_screen(total_progress)[1]
+                bottom = self.position_on_screen(total_progress + contig.title_padding - 2)[1]
+                placements.append((total_progress, contig, top, bottom))
             total_progress += contig.title_padding + len(contig.seq) + contig.tail_padding
+        return placements
 
 
-    def draw_title(self, total_progress, contig):
+    def draw_title(self, total_progress, contig, canvas_top=0):
+        """canvas_top is the image row where self.image starts when drawing in bands"""
         upper_left = self.position_on_screen(total_progress)
         bottom_right = self.position_on_screen(total_progress + contig.title_padding - 2)
         width, height = bottom_right[0] - upper_left[0], bottom_right[1] - upper_left[1]
@@ -392,6 +724,7 @@ class TileLayout(object):
                 title_width = 50 // 2
 
         contig_name = contig.name
+        upper_left = (upper_left[0], upper_left[1] - canvas_top)
         self.write_title(contig_name, width, height, font_size, title_lines, title_width, upper_left,
                          vertical_label, self.image)
 
@@ -408,7 +741,13 @@ class TileLayout(object):
         if vertical_label:
             txt = txt.rotate(90, expand=True)
             upper_left[0] += 8  # adjusts baseline for more polish
-        canvas.paste(txt, (upper_left[0], upper_left[1]), txt)
+        paste_on_canvas(canvas, txt, (upper_left[0], upper_left[1]), txt)
+
+    def load_fonts(self):
+        # precomputing fonts turns out to be a big performance gain
+        sizes = [9, 38, 380, 380 * 2]
+        self.fonts = {size: self.get_font(size) for size in sizes}
+        self.fonts[sizes[0]] = ImageFont.load_default()  # looks better at low res
 
     def get_font(self, font_size):
         if font_size in self.fonts:
@@ -435,14 +774,18 @@ class TileLayout(object):
             del self.draw
         except BaseException:
             pass  # this is just memory optimization
-        if not no_webpage:  # sources directory only exists for non-quick
-            output_folder = os.path.join(output_folder, 'sources',)
-        self.final_output_location = os.path.join(output_folder, output_file_name + ".png")
+        self.final_output_location = self.image_output_path(output_folder, output_file_name, no_webpage)
         print("-- Writing:", self.final_output_location, "--")
         self.image.save(self.final_output_location, 'PNG')
         # del self.image
 
 
+    def image_output_path(self, output_folder, output_file_name, no_webpage):
+        if not no_webpage:  # sources directory only exists for non-quick
+            output_folder = os.path.join(output_folder, 'sources',)
+        return os.path.join(output_folder, output_file_name + ".png")
+
+
     def max_dimensions(self, image_length):
         """ Uses Tile Layout to find the largest chunk size in each dimension (XY) that the
         image_length will reach
@@ -531,8 +874,8 @@ class TileLayout(object):
                             "layout_algorithm": self.layout_algorithm,
                             "each_layout": self.all_layouts_json(),
                             "ContigSpacingJSON": self.contig_json(),
-                            "originalImageWidth": str(self.image.width if self.image else 1),
-                            "originalImageHeight": str(self.image.height if self.image else 1),
+                            "originalImageWidth": str(self.image.width if self.image else self.image_dimensions[0]),
+                            "originalImageHeight": str(self.image.height if self.image else self.image_dimensions[1]),
                             "image_origin": '[0,0]',
                             "includeDensity": 'false',
                             "date": datetime.now().strftime("%Y-%m-%d"),
@@ -577,34 +920,6 @@ class TileLayout(object):
         return contigs_per_file
 
 
-    def get_packed_coordinates(self):
-        """An attempted speed up for draw_nucleotides() that was the same speed.  In draw_nucleotides() the
-        extra code was:
-            coordinates = self.get_packed_coordinates()  # precomputed sets of 100,000
-            seq_consumed = 0
-            columns_batched = 0
-            for column in range(0, seq_length, 100000):
-                if seq_length - column > 100000:
-                    columns_batched += 1
-                    x, y = self.position_on_screen(total_progress)  # only one call per column
-                    for cx, cy, offset in coordinates:
-                        self.draw_pixel(contig.seq[column + offset], x + cx, y + cy)
-                    total_progress += 100000
-                    seq_consumed += 100000
-                else:
-                    pass  # loop will exit and remaining seq will be handled individually
-
-        This method is an optimization that computes all offsets for a column once so they can be reused.
-        The output looks like this:  (x, y, sequence offset)
-        [(0, 0, 0), (1, 0, 1), (2, 0, 2), (3, 0, 3), ... (0, 1, 10), (1, 1, 11), (2, 1, 12), (3, 1, 13),"""
-        line = range(self.levels[0].modulo)
-        column_height = self.levels[1].modulo
-        coords = []
-        for y in range(column_height):
-            coords.extend([(x, y, y * self.levels[0].modulo + x) for x in line])
-        return coords
-
-
     def additional_html_content(self, html_content):
         return {}  # override in children
 
@@ -649,5 +964,6 @@ def write_contigs_to_chunks_dir(project_dir, fasta_name, contigs):
         pass
     for i, contig in enumerate(contigs):
         filename = os.path.join(chunks_dir, '%i.fa' % i)
-        write_contigs_to_file(filename, [contig],verbose=False)
+        # one read per contig instead of one per 70bp line when seq is a SequenceView
+        write_contigs_to_file(filename, [Contig(contig.name, str(contig.seq))], verbose=False)
 
@@ -36,13 +36,22 @@
 #===============================================================================
 
 
+import hashlib
+import io
 import math
+import multiprocessing
 import optparse
 import os
+import shutil
+from collections import deque
 from PIL import Image as PILImage
 import sys
 import xml.dom.minidom
 
+import numpy as np
+
+from FluentDNA.TileDatabase import TileDatabase
+
 # Monkey Patch: Sets a much larger size to avoid the DecompressionBombWarning that
 # scares users.  FluentDNA will suck up a lot of RAM, but especially on clusters,
 # this warning shouldn't go off all the time.  I've been able to reliably generate
@@ -52,12 +61,13 @@ PILImage.MAX_IMAGE_PIXELS = 10 * 1024 * 1024 * 1024  # 10GB
 
 NS_DEEPZOOM = "http://schemas.microsoft.com/deepzoom/2008"
 
+# Pillow 10 dropped the CUBIC and ANTIALIAS aliases, BICUBIC and LANCZOS are the same filters
 resize_filter_map = {
-    "cubic": PILImage.CUBIC,
+    "cubic": PILImage.BICUBIC,
     "bilinear": PILImage.BILINEAR,
     "bicubic": PILImage.BICUBIC,
     "nearest": PILImage.NEAREST,
-    "antialias": PILImage.ANTIALIAS,
+    "antialias": PILImage.LANCZOS,
     }
 
 image_format_map = {
@@ -169,7 +179,8 @@ class Image(object):
 class ImageCreator(object):
     """Creates Deep Zoom images."""
     def __init__(self, tile_size=256, tile_overlap=1, tile_format="jpg",
-                 image_quality=0.95, resize_filter=None):
+                 image_quality=0.95, resize_filter=None, from_base_tiles=False, workers=1,
+                 tile_container=False):
         self.tile_size = int(tile_size)
         self.tile_format = tile_format
         self.tile_overlap = _clamp(int(tile_overlap), 0, 10)
@@ -177,6 +188,15 @@ class ImageCreator(object):
         if not tile_format in image_format_map:
             self.tile_format = "jpg"
         self.resize_filter = resize_filter
+        # Only the full resolution level is cut from the source, the rest are read back from its tiles
+        self.from_base_tiles = from_base_tiles
+        self.workers = workers  # processes encoding tiles
+        self.tile_container = tile_container  # one .db file instead of a folder of tiles
+
+    def get_resize_filter(self):
+        if (self.resize_filter is None) or (self.resize_filter not in resize_filter_map):
+            return PILImage.LANCZOS
+        return resize_filter_map[self.resize_filter]
 
     def get_image(self, level):
         """Returns the bitmap image at the given level."""
@@ -185,9 +205,14 @@ class ImageCreator(object):
         # don't transform to what we already have
         if self.descriptor.width == width and self.descriptor.height == height:
             return self.image
-        if (self.resize_filter is None) or (self.resize_filter not in resize_filter_map):
-            return self.image.resize((width, height), PILImage.ANTIALIAS)
-        return self.image.resize((width, height), resize_filter_map[self.resize_filter])
+        return self.resize(self.image, level)
+
+    def resize(self, image, level):
+        """Resizes image to the dimensions of level"""
+        size = self.descriptor.get_dimensions(level)
+        if image.mode == 'P':
+            return _resize_palette_image(image, size, self.get_resize_filter())
+        return image.resize(size, self.get_resize_filter())
 
     def tiles(self, level):
         """Iterator for all tiles in the given level. Returns (column, row) of a tile."""
@@ -206,29 +231,283 @@ class ImageCreator(object):
                                         tile_overlap=self.tile_overlap,
                                         tile_format=self.tile_format)
         destination = _expand(destination)
-        image_name = os.path.splitext(os.path.basename(destination))[0]
-        dir_name = os.path.dirname(destination)
-        image_files = _ensure(os.path.join(_ensure(dir_name), "%s_files"%image_name))
-
-        # Create tiles
-        for level in range(self.descriptor.num_levels):
-            level_dir = _ensure(os.path.join(image_files, str(level)))
-            level_image = self.get_image(level)
-            for (column, row) in self.tiles(level):
-                bounds = self.descriptor.get_tile_bounds(level, column, row)
-                tile = level_image.crop(bounds)
-                format = self.descriptor.tile_format
-                tile_path = os.path.join(level_dir,
-                                         "%s_%s.%s"%(column, row, format))
-                tile_file = open(tile_path, "wb")
-                if self.descriptor.tile_format == "jpg":
-                    tile.save(tile_file, "JPEG",
-                              quality=int(self.image_quality * 100))
-                else:
-                    tile.save(tile_file, self.descriptor.tile_format)
-
-        # Create descriptor
-        self.descriptor.save(destination)
+        _ensure(os.path.dirname(destination))
+
+        # Create tiles from full resolution down.  Each level is half of the level above it,
+        # which is much less work than resizing the full image every time.
+        level_image = None
+        self.tile_writer = _TileWriter(self.descriptor, destination, self.image_quality, self.workers,
+                                       tile_container=self.tile_container)
+        try:
+            for level in reversed(range(self.descriptor.num_levels)):
+                level_image = self.image if level_image is None else self.resize(level_image, level)
+                self.write_tiles(level_image, level)
+                self.tile_writer.finish_level(level)
+                if self.from_base_tiles:
+                    break
+        finally:
+            self.tile_writer.close()  # waits for the last tiles
+        del level_image  # the previous level is released when the next one replaces it
+        self.image = None
+
+        if self.from_base_tiles:  # also creates the descriptor
+            self.create_from_base_tiles(destination)
+        else:  # Create descriptor
+            self.descriptor.save(destination)
+
+    def write_tiles(self, level_image, level):
+        columns, rows = self.descriptor.get_num_tiles(level)
+        for row in range(rows):
+            self.tile_writer.write_row(level_image, 0, level, row)
+
+    def create_from_base_tiles(self, destination):
+        """Creates every level below full resolution from the full resolution tiles that are
+        already in the destination folder.  Tiles are read back one row at a time, so the
+        full image doesn't need to be in memory.  Lower levels average 2x2 pixels."""
+        destination = _expand(destination)
+        descriptor = self.descriptor
+        width, height = descriptor.width, descriptor.height
+        pyramid = StreamingImageCreator(width, height, destination, descriptor.tile_size,
+                                        descriptor.tile_overlap, descriptor.tile_format, base_level=False,
+                                        workers=self.workers, tile_container=self.tile_container)
+        level = descriptor.num_levels - 1
+        columns, rows = descriptor.get_num_tiles(level)
+        size = descriptor.tile_size
+        for row in range(rows):
+            band = None
+            for column in range(columns):
+                x1, y1 = descriptor.get_tile_bounds(level, column, row)[:2]
+                tile = pyramid.tile_writer.read_tile(level, column, row)
+                left, top = column * size - x1, row * size - y1  # skip the overlap
+                inside = tile.crop((left, top, left + min(size, width - column * size),
+                                    top + min(size, height - row * size)))
+                if band is None:
+                    band = PILImage.new(tile.mode, (width, inside.height))
+                    if tile.mode == 'P':
+                        band.putpalette(tile.getpalette())
+                band.paste(inside, (column * size, 0))
+            pyramid.append(band)
+        pyramid.close()
+
+
+class StreamingImageCreator(object):
+    """Creates a Deep Zoom image from horizontal bands of the full resolution image, supplied
+    top to bottom with append().  Each level only holds the rows for its current row of tiles,
+    so the full image never has to exist.  Lower levels average 2x2 pixels of the level above."""
+    def __init__(self, width, height, destination, tile_size=256, tile_overlap=1, tile_format="png",
+                 base_level=True, workers=1, tile_container=False):
+        self.descriptor = DZIDescriptor(width=width,
+                                        height=height,
+                                        tile_size=tile_size,
+                                        tile_overlap=_clamp(int(tile_overlap), 0, 10),
+                                        tile_format=tile_format)
+        self.destination = _expand(destination)
+        _ensure(os.path.dirname(self.destination))
+        self.base_level = base_level  # False when the full resolution tiles were already written
+        self.tile_writer = _TileWriter(self.descriptor, self.destination, workers=workers,
+                                       tile_container=tile_container, new_image=base_level)
+        self.levels = [_LevelWriter(self.descriptor, level, self.tile_writer)
+                       for level in range(self.descriptor.num_levels)]
+
+    def append(self, band):
+        """band is a PIL image the full width of the source.  Palette images keep their palette
+        at full resolution, lower levels are RGB."""
+        if not self.base_level:
+            band = band.convert('RGB') if band.mode == 'P' else band
+        elif band.mode == 'P':
+            self.levels[-1].append(np.asarray(band), band.getpalette())
+            band = band.convert('RGB')
+        else:
+            self.levels[-1].append(np.asarray(band))
+        rows = np.asarray(band)
+        for level in reversed(self.levels[:-1]):
+            rows = level.halve_and_append(rows)
+
+    def close(self):
+        """Writes the last rows of tiles in every level and the descriptor file."""
+        rows = None  # rows of the level above that haven't reached this level yet
+        for level in reversed(self.levels if self.base_level else self.levels[:-1]):
+            if rows is not None:
+                rows = level.halve_and_append(rows)
+            last_row = level.finish()
+            if last_row is not None:
+                rows = last_row if rows is None else np.concatenate([rows, last_row])
+        self.tile_writer.close()
+        self.descriptor.save(self.destination)
+
+
+class _LevelWriter(object):
+    """Buffers rows of one pyramid level and writes each row of tiles once it's complete"""
+    def __init__(self, descriptor, level, tile_writer):
+        self.descriptor = descriptor
+        self.tile_writer = tile_writer
+        self.level = level
+        self.width, self.height = descriptor.get_dimensions(level)
+        self.columns, self.tile_rows = descriptor.get_num_tiles(level)
+        self.buffer = None
+        self.buffer_top = 0  # pixel row of buffer[0]
+        self.tile_row = 0  # next row of tiles to be written
+        self.palette = None
+        self.odd_row = None  # unpaired row waiting to be averaged into the next level
+
+    def append(self, rows, palette=None):
+        self.palette = palette
+        self.buffer = rows if self.buffer is None else np.concatenate([self.buffer, rows])
+        self.write_finished_tiles()
+
+    def halve_and_append(self, rows):
+        """Rows from the level above.  Returns the rows of this level for the next level down."""
+        if self.odd_row is not None:
+            rows = np.concatenate([self.odd_row, rows])
+            self.odd_row = None
+        if len(rows) % 2:
+            rows, self.odd_row = rows[:-1], rows[-1:]
+        halved = _halve(rows, self.width)
+        self.append(halved)
+        return halved
+
+    def finish(self):
+        """Averages a last unpaired row with itself.  Returns that row so it reaches the next level."""
+        rows = None
+        if self.odd_row is not None:
+            rows = _halve(np.concatenate([self.odd_row, self.odd_row]), self.width)
+            self.odd_row = None
+            self.append(rows)
+        self.write_finished_tiles()
+        if self.tile_row < self.tile_rows:
+            print("Warning: level %i is missing %i rows of tiles" % (self.level, self.tile_rows - self.tile_row))
+        return rows
+
+    def write_finished_tiles(self):
+        while self.tile_row < self.tile_rows:
+            y1, y2 = self.descriptor.get_tile_bounds(self.level, 0, self.tile_row)[1::2]
+            if self.buffer is None or self.buffer_top + len(self.buffer) < y2:
+                return  # this row of tiles isn't drawn yet
+            self.tile_writer.write_row(self.band_image(self.buffer[y1 - self.buffer_top: y2 - self.buffer_top]),
+                                       y1, self.level, self.tile_row)
+            self.tile_row += 1
+            next_top = self.descriptor.get_tile_bounds(self.level, 0, self.tile_row)[1] \
+                if self.tile_row < self.tile_rows else self.height
+            self.buffer = self.buffer[next_top - self.buffer_top:]
+            self.buffer_top = next_top
+        self.tile_writer.finish_level(self.level)
+
+    def band_image(self, pixels):
+        if self.palette is not None:
+            band = PILImage.frombytes('P', (pixels.shape[1], pixels.shape[0]), np.ascontiguousarray(pixels).tobytes())
+            band.putpalette(self.palette)
+            return band
+        return PILImage.fromarray(np.ascontiguousarray(pixels))
+
+
+class _TileWriter(object):
+    """Saves rows of tiles, either as files in the destination's _files folder or in a
+    TileDatabase next to the destination.  Tiles with the same pixels as a tile that was already
+    saved in the same level, like all the white padding, are only encoded once.  Files are hard
+    linked to the first copy and the database points them at the same image.  Each level is linked
+    and forgotten by finish_level(), so the hashes kept never outgrow one level.
+    With more than one worker, tiles are encoded by a pool of processes.  Only a couple
+    of rows per worker are queued at a time to keep memory bounded."""
+    def __init__(self, descriptor, destination, image_quality=0.95, workers=1, deduplicate=True,
+                 tile_container=False, new_image=True):
+        self.descriptor = descriptor
+        self.image_quality = image_quality
+        self.image_files = os.path.join(os.path.dirname(destination),
+                                        "%s_files" % os.path.splitext(os.path.basename(destination))[0])
+        container_path = os.path.splitext(destination)[0] + '.db'
+        self.container = None
+        if tile_container:
+            self.container = TileDatabase(container_path, overwrite=new_image)
+            self.container.set_metadata(format=descriptor.tile_format, tile_size=descriptor.tile_size,
+                                        overlap=descriptor.tile_overlap, width=descriptor.width,
+                                        height=descriptor.height)
+        elif new_image and os.path.exists(container_path):
+            os.remove(container_path)  # the server would show old tiles from the database
+        self.pool = multiprocessing.Pool(workers) if workers > 1 else None
+        self.max_pending = 2 * workers
+        self.pending = deque()
+        self.deduplicate = deduplicate or tile_container
+        self.saved_tiles = {}  # level: {content hash: path of the first tile with that content}
+        self.duplicates = {}  # level: [(original path, duplicate path)] linked once the originals are written
+        self.unique_count, self.duplicate_count = 0, 0
+        self.level_dirs = set()
+
+    def tile_path(self, level, column, row):
+        level_dir = os.path.join(self.image_files, str(level))
+        if self.container is None and level_dir not in self.level_dirs:
+            _ensure(self.image_files)
+            _ensure(level_dir)
+            self.level_dirs.add(level_dir)
+        return os.path.join(level_dir, "%s_%s.%s" % (column, row, self.descriptor.tile_format))
+
+    def write_row(self, image, top, level, row):
+        """image holds the pixel rows for this row of tiles, starting at pixel row top"""
+        unique = []
+        columns = self.descriptor.get_num_tiles(level)[0]
+        for column in range(columns):
+            x1, y1, x2, y2 = self.descriptor.get_tile_bounds(level, column, row)
+            tile = image.crop((x1, y1 - top, x2, y2 - top))
+            tile_path = self.tile_path(level, column, row)
+            tile_id = None
+            if self.deduplicate:
+                content = hashlib.md5(tile.tobytes())
+                content.update(str((tile.mode, tile.size)).encode())
+                if tile.mode == 'P':
+                    content.update(bytes(bytearray(tile.getpalette())))
+                tile_id = content.hexdigest()
+                if self.container is not None:
+                    self.container.add_tile(level, column, row, tile_id)
+                saved = self.saved_tiles.setdefault(level, {})
+                if tile_id in saved:
+                    self.duplicates.setdefault(level, []).append((saved[tile_id], tile_path))
+                    continue
+                saved[tile_id] = tile_path
+            unique.append((tile, tile_path, tile_id))
+        job = (unique, self.descriptor.tile_format, self.image_quality, self.container is not None)
+        if self.pool is None:
+            self.store(_save_tiles(*job))
+            return
+        while len(self.pending) >= self.max_pending:
+            self.store(self.pending.popleft().get())  # also raises any exception from the worker
+        self.pending.append(self.pool.apply_async(_save_tiles, job))
+
+    def store(self, encoded_tiles):
+        for tile_id, data in encoded_tiles:
+            self.container.add_image(tile_id, data)
+
+    def read_tile(self, level, column, row):
+        if self.container is not None:
+            return PILImage.open(io.BytesIO(self.container.get_tile(level, column, row)))
+        return PILImage.open(self.tile_path(level, column, row))
+
+    def finish_level(self, level):
+        """Links the duplicates of a level once all its rows were written and drops its hashes"""
+        duplicates = self.duplicates.pop(level, [])
+        if duplicates and self.container is None:
+            while self.pending:  # the originals have to be on disk
+                self.store(self.pending.popleft().get())
+            for original, duplicate in duplicates:
+                _link_tile(original, duplicate)
+        self.unique_count += len(self.saved_tiles.pop(level, {}))
+        self.duplicate_count += len(duplicates)
+
+    def close(self):
+        if self.pool is not None:
+            try:
+                while self.pending:
+                    self.store(self.pending.popleft().get())
+            finally:
+                self.pool.close()
+                self.pool.join()
+                self.pool = None
+        for level in list(self.saved_tiles):  # levels that were never finished
+            self.finish_level(level)
+        if self.container is not None:
+            self.container.close()
+            self.container = None
+        if self.duplicate_count:
+            print("Saved %i unique tiles, %i duplicates were only stored once" %
+                  (self.unique_count, self.duplicate_count))
 
 
 class CollectionCreator(object):
@@ -365,6 +644,64 @@ def _ensure(d):
         os.mkdir(d)
     return d
 
+def _resize_palette_image(image, size, resample, strip_height=1024):
+    """PIL quietly uses nearest neighbor when resizing palette images, which looks bad for
+    zoomed out sequence.  Strips are converted to RGB and resized one at a time so the full
+    resolution RGB image never has to exist in memory."""
+    width, height = size
+    y_scale = image.height / float(height)
+    margin = int(math.ceil(y_scale * 3)) + 2  # covers the filter support at this scale
+    resized = PILImage.new('RGB', size)
+    for top in range(0, height, strip_height):
+        bottom = min(height, top + strip_height)
+        source_top, source_bottom = top * y_scale, bottom * y_scale
+        crop_top = max(0, int(source_top) - margin)
+        crop_bottom = min(image.height, int(math.ceil(source_bottom)) + margin)
+        strip = image.crop((0, crop_top, image.width, crop_bottom)).convert('RGB')
+        box = (0, source_top - crop_top, image.width, source_bottom - crop_top)
+        resized.paste(strip.resize((width, bottom - top), resample, box), (0, top))
+    return resized
+
+def _save_tiles(tiles, tile_format, image_quality, to_bytes=False):
+    """Saves each (tile, path, tile_id) to a file, or returns a list of (tile_id, encoded bytes)
+    when to_bytes is set.  Module level so it can run in a worker process."""
+    encoded = []
+    for tile, tile_path, tile_id in tiles:
+        if to_bytes:
+            tile_file = io.BytesIO()
+        else:
+            _remove_old_tile(tile_path)
+            tile_file = open(tile_path, "wb")
+        if tile_format == "jpg":
+            tile.save(tile_file, "JPEG", quality=int(image_quality * 100))
+        else:
+            tile.save(tile_file, tile_format)
+        if to_bytes:
+            encoded.append((tile_id, tile_file.getvalue()))
+        tile_file.close()
+    return encoded
+
+def _remove_old_tile(tile_path):
+    """A tile from a previous run may be hard linked to other tiles.  Writing into it would change them all."""
+    if os.path.exists(tile_path):
+        os.remove(tile_path)
+
+def _link_tile(original, duplicate):
+    _remove_old_tile(duplicate)
+    try:
+        os.link(original, duplicate)
+    except (OSError, AttributeError):  # file system without hard links
+        shutil.copyfile(original, duplicate)
+
+def _halve(rows, width):
+    """Averages each 2x2 square of pixels.  rows must have an even height, an odd width
+    repeats the last column so the result is width pixels wide."""
+    rows = rows.astype(np.uint16)
+    if rows.shape[1] % 2:
+        rows = np.concatenate([rows, rows[:, -1:]], axis=1)
+    summed = rows[0::2, 0::2] + rows[1::2, 0::2] + rows[0::2, 1::2] + rows[1::2, 1::2]
+    return ((summed + 2) // 4).astype(np.uint8)[:, :width]
+
 def _clamp(val, min, max):
     if val < min:
         return min
@@ -392,6 +729,9 @@ def main():
     parser.add_option("-r", "--resize_filter", dest="resize_filter", default="antialias",
                       help="Type of filter for resizing (bicubic, nearest, \
                             bilinear, antialias (best). Default: antialias")
+    parser.add_option("-b", "--from_base_tiles", dest="from_base_tiles", action="store_true",
+                      default=False, help="Make the lower levels from the full resolution tiles \
+                                          instead of the source image.  Uses less memory.")
 
     (options, args) = parser.parse_args()
 
@@ -412,7 +752,8 @@ def main():
     creator = ImageCreator(tile_size=options.tile_size,
                            tile_format=options.tile_format,
                            image_quality=options.image_quality,
-                           resize_filter=options.resize_filter)
+                           resize_filter=options.resize_filter,
+                           from_base_tiles=options.from_base_tiles)
     creator.create(source, options.destination)
 
 if __name__ == "__main__":
@@ -97,12 +97,12 @@ def query_yes_no(question, default='yes'):
 
 def run_server(output_dir=None):
     try:
-        from http import server
         from socketserver import TCPServer
     except ImportError:  # Python 2 imports
-        import SimpleHTTPServer as server
         from SocketServer import TCPServer
 
+    from FluentDNA.TileDatabase import TileContainerHandler
+
     SERVER_HOME, base = base_directories('')
     print("Setting up HTTP Server based from", SERVER_HOME)
     os.makedirs(SERVER_HOME, exist_ok=True)
@@ -116,7 +116,7 @@ def run_server(output_dir=None):
     success = launch_browser(url, output_dir)
     try: # Try to determine if this is running in a terminal
         import FluentDNA
-        handler = server.SimpleHTTPRequestHandler
+        handler = TileContainerHandler
         httpd = TCPServer((ADDRESS, PORT), handler)
         print("Open a browser at " + url)
         print("If you are using this computer remotely, use CTRL+C to close the browser and "
@@ -170,7 +170,8 @@ def ddv(args):
         #Don't overwrite old webpage when regenerating zoom stack from an image
         layout.generate_html(args.output_dir, args.output_name, overwrite_files=False)
         print("Creating Deep Zoom Structure for Existing Image...")
-        create_deepzoom_stack(args.image, os.path.join(args.output_dir, 'GeneratedImages', "dzc_output.xml"))
+        create_deepzoom_stack(args.image, os.path.join(args.output_dir, 'GeneratedImages', "dzc_output.xml"),
+                              workers=args.workers, tile_container=args.tile_container)
         print("Done creating Deep Zoom Structure.")
         done(args, args.output_dir)
 
@@ -206,7 +207,8 @@ def ddv(args):
                                        squish_gaps=args.squish_gaps,
                                        show_translocations_only=args.show_translocations_only,
                                        aligned_only=args.aligned_only,
-                                       extract_contigs=args.contigs)
+                                       extract_contigs=args.contigs,
+                                       workers=args.workers)
             print("Creating Gapped and Unique Fastas from Chain File...")
             batches = chain_parser.parse_chain(args.contigs)
             del chain_parser
@@ -221,7 +223,8 @@ def ddv(args):
                     copy_to_sources(batch.output_folder, args.chain_file)
             done(args)
     elif args.layout == "annotation_track":
-        layout = AnnotatedTrackLayout(args.fasta, args.ref_annotation, args.annotation_width)
+        layout = AnnotatedTrackLayout(args.fasta, args.ref_annotation, args.annotation_width,
+                                      indexed_color=args.indexed_color)
         start_time = layout.render_genome(args.output_dir, args.output_name, args.contigs)
         finish_webpage(args, layout, args.output_name, start_time)
         done(args, args.output_dir)
@@ -244,7 +247,10 @@ def ddv(args):
                                                     second_source=args.fasta, output_prefix=base_path,
                                                     trial_run=args.trial_run,
                                                     separate_translocations=args.separate_translocations,
-                                                    preserve_Ns=args.preserve_Ns)
+                                                    preserve_Ns=args.preserve_Ns,
+                                                    extra_chain_names=args.extra_chain_files or (),
+                                                    extract_contigs=args.contigs,
+                                                    workers=args.workers)
         batches = unique_chain_parser.parse_chain(args.contigs)
         print("Done creating Gapped and Unique Fastas.")
         del unique_chain_parser
@@ -311,7 +317,8 @@ def create_parallel_viz_from_fastas(args, n_genomes, output_dir, output_name, fa
         except BaseException:
             print("Column widths should be a python expression of a list of integers ex: [30,80]", file=sys.stderr)
     layout = ParallelLayout(n_genomes=n_genomes, low_contrast=args.low_contrast, base_width=args.base_width,
-                            column_widths=column_widths, border_boxes=border_boxes)
+                            column_widths=column_widths, border_boxes=border_boxes,
+                            indexed_color=args.indexed_color)
     start_time = layout.process_file(output_dir, output_name, fastas, args.no_webpage, args.contigs)
     args.output_dir = output_dir
     finish_webpage(args, layout, output_name, start_time)
@@ -322,12 +329,35 @@ def create_tile_layout_viz_from_fasta(args, fasta, output_name, layout=None):
     if layout is None:
         layout = TileLayout(use_titles=args.use_titles, sort_contigs=args.sort_contigs,
                             low_contrast=args.low_contrast, base_width=args.base_width,
-                            custom_layout=args.custom_layout)
+                            custom_layout=args.custom_layout, indexed_color=args.indexed_color,
+                            streaming=args.streaming, direct_tiles=args.direct_tiles, workers=args.workers,
+                            tile_container=args.tile_container)
     start_time = layout.process_file(fasta, args.output_dir, output_name, args.no_webpage, args.contigs)
 
     finish_webpage(args, layout, output_name, start_time)
 
 
+def print_layout_plan(args):
+    """Tiled layout dimensions and memory from the contig lengths alone.  Nothing is written
+    except the .fai index next to the fasta."""
+    layout = TileLayout(use_titles=args.use_titles, sort_contigs=args.sort_contigs,
+                        low_contrast=args.low_contrast, base_width=args.base_width,
+                        custom_layout=args.custom_layout, indexed_color=args.indexed_color,
+                        streaming=args.streaming, direct_tiles=args.direct_tiles, workers=args.workers,
+                        tile_container=args.tile_container)
+    start_time = datetime.now()
+    plan = layout.plan_layout(args.fasta, args.contigs)
+    megabytes = lambda n: '{:,.1f} MB'.format(n / 1024.0 / 1024.0)
+    print("Layout plan for", args.fasta, "in", datetime.now() - start_time)
+    print("  {:,} contigs, {:,}bp in {} mega rows".format(plan['contig_count'], plan['sequence_length'],
+                                                           plan['megarows']))
+    print("  Image dimensions are {} x {} pixels ({:,.1f} megapixels)".format(
+        plan['width'], plan['height'], plan['width'] * plan['height'] / 1e6))
+    print("  Estimated peak memory:", megabytes(plan['image_memory'] + plan['sequence_memory']),
+          "(image", megabytes(plan['image_memory']) + ", sequence", megabytes(plan['sequence_memory']) + ")")
+    return plan
+
+
 def combine_files(batches, args, output_name):
     from itertools import chain
     contigs = list(chain(*[read_contigs(batch.fastas[0]) for batch in batches]))
@@ -335,21 +365,30 @@ def combine_files(batches, args, output_name):
     write_contigs_to_file(fasta_output, contigs)
     create_tile_layout_viz_from_fasta(args, fasta_output, output_name)
     copy_to_sources(args.output_dir, args.chain_file)
+    for chain_file in args.extra_chain_files or []:
+        copy_to_sources(args.output_dir, chain_file)
 
 
 def finish_webpage(args, layout, output_name, start_time=datetime.now()):
     final_location = layout.final_output_location
-    print("Done creating Large Image at ", final_location)
+    direct_tiles = layout.direct_tiles
+    if direct_tiles:
+        print("Done creating Deep Zoom tiles from the sequence. Output at", final_location)
+    else:
+        print("Done creating Large Image at ", final_location)
     if not args.no_webpage:
-        with open(os.path.join(os.path.dirname(final_location), 'command.sh'), 'w') as f:
+        sources_dir = os.path.join(args.output_dir, 'sources') if direct_tiles else os.path.dirname(final_location)
+        with open(os.path.join(sources_dir, 'command.sh'), 'w') as f:
             f.write(archive_execution_command() + '\n')  # original command that got us here
         layout.generate_html(args.output_dir, output_name)
         del layout
         gc.collect()  # it's important to free the large amount of RAM this uses
-        print("Creating Deep Zoom Structure from Generated Image...")
-        create_deepzoom_stack(os.path.join(args.output_dir, final_location),
-                              os.path.join(args.output_dir, 'GeneratedImages', "dzc_output.xml"))
-        print("Done creating Deep Zoom Structure")
+        if not direct_tiles:  # tiles were already drawn from the sequence
+            print("Creating Deep Zoom Structure from Generated Image...")
+            create_deepzoom_stack(os.path.join(args.output_dir, final_location),
+                                  os.path.join(args.output_dir, 'GeneratedImages', "dzc_output.xml"),
+                                  workers=args.workers, tile_container=args.tile_container)
+            print("Done creating Deep Zoom Structure")
     else:
         del layout
         gc.collect()  # it's important to free the large amount of RAM this uses
@@ -448,6 +487,41 @@ def main():
                         help="Use if you only want an image.  No webpage or zoomstack will be calculated.  "
                         "You can use --image option later to resume the process to get a deepzoom stack.",
                         dest="no_webpage")
+    parser.add_argument("-ic", "--indexed_color",
+                        action='store_true',
+                        help="Draw with an 8-bit color palette instead of full RGB.  Uses about a third "
+                             "of the RAM for large genomes and writes smaller PNGs.  Titles are limited to "
+                             "shades of grey.  Used by tiled, parallel and annotation_track layouts.",
+                        dest="indexed_color")
+    parser.add_argument("-st", "--streaming",
+                        action='store_true',
+                        help="Draw and save the image one mega row at a time so the whole image is never "
+                             "held in memory.  For genomes too big to fit in RAM.  Only for the tiled layout.",
+                        dest="streaming")
+    parser.add_argument("-dt", "--direct_tiles",
+                        action='store_true',
+                        help="Draw the Deep Zoom tiles for the webpage straight from the sequence without "
+                             "making the large PNG first.  Add --streaming to also save the PNG in the same "
+                             "pass.  Only for the tiled layout.",
+                        dest="direct_tiles")
+    parser.add_argument("-wk", "--workers",
+                        type=int,
+                        default=1,
+                        help="Number of processes used to draw the tiled layout one mega row at a time, "
+                             "to encode the Deep Zoom tiles and to parse each chromosome of a chain file.  "
+                             "Each worker holds a mega row or a couple of rows of tiles in memory.  Default: 1",
+                        dest="workers")
+    parser.add_argument("-tc", "--tile_container",
+                        action='store_true',
+                        help="Store the Deep Zoom tiles in one GeneratedImages/dzc_output.db file instead of "
+                             "thousands of small files.  The results must be viewed with the FluentDNA server.",
+                        dest="tile_container")
+    parser.add_argument("-po", "--plan_only",
+                        action='store_true',
+                        help="Only read the contig names and lengths, then print the image dimensions and "
+                             "estimated memory of the tiled layout without rendering anything.  "
+                             "Useful for sizing a cluster job.",
+                        dest="plan_only")
     parser.add_argument("-ns", "--no_server",
                         action='store_true',
                         help="Prevents the server from starting after a successful render.  "
@@ -462,6 +536,12 @@ def main():
                         type=str,
                         help="Path to Chain File when doing Parallel Comparisons layout.",
                         dest="chain_file")
+    parser.add_argument("-xc", "--extra_chainfiles",
+                        nargs='+',
+                        type=str,
+                        help="More chain files against the same reference for a Unique layout.  "
+                             "Anything aligned in any of the chain files is left out.",
+                        dest="extra_chain_files")
     parser.add_argument("-t", "--separate_translocations",
                         action='store_true',
                         help="Don't edit in translocations, list them at the end.",
@@ -597,8 +677,17 @@ def main():
         parser.error("The 'chainfile' argument is only used when doing a Parallel or Unique layout!")
     if args.chain_file and args.extra_fastas and len(args.extra_fastas) > 1:
         parser.error("Chaining more than two samples is currently not supported! Please only specify one 'extrafastas' when using a Chain input.")
+    if args.streaming and args.layout != 'tiled':
+        parser.error("--streaming is currently only available for the tiled layout.")
+    if args.direct_tiles and (args.layout != 'tiled' or args.no_webpage):
+        parser.error("--direct_tiles makes the webpage tiles for the tiled layout.  "
+                     "It can't be used with --no_webpage or other layouts.")
+    if args.plan_only and args.layout != 'tiled':
+        parser.error("--plan_only is currently only available for the tiled layout.")
     if args.layout == "unique" and not args.chain_file:
         parser.error("You must have a 'chainfile' to make a Unique layout!")
+    if args.extra_chain_files and args.layout != "unique":
+        parser.error("The 'extra_chainfiles' argument is only used when doing a Unique layout!")
     if args.show_translocations_only and args.separate_translocations:
         parser.error("It just doesn't make sense to ask to show translocations in context while separating them.  You've got to pick one or the other.")
 
@@ -623,6 +712,9 @@ def main():
         args.output_name = args.output_name.strip()
     args.use_titles = not args.no_titles
     args.use_labels = not args.no_labels
+    if args.plan_only:
+        print_layout_plan(args)
+        sys.exit(0)
 
     #Output directory: after args.output_name is set
     SERVER_HOME, base_path = base_directories(args.output_name)
@@ -16,7 +16,7 @@ def simple_resize(source, scale_factor):
     width, height = image.width, image.height
     width, height = int(width * scale_factor), int(height * scale_factor)
     print("Starting resize:", width, height)
-    filter = PILImage.ANTIALIAS
+    filter = PILImage.LANCZOS
     if scale_factor > 1:
         filter = PILImage.NEAREST  # don't blur pixel lines when upscaling
     resized = image.resize((width, height), filter)
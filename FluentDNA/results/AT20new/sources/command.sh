@@ -0,0 +1 @@
+fluentdna.py --fasta="example_data/phiX.fa" --ref_annotation="/tmp/phix.gff" --layout="annotation_track" --outname="AT20new" --no_server
@@ -0,0 +1 @@
+fluentdna.py --fasta="example_data/phiX.fa" --ref_annotation="/tmp/phix.gff" --layout="annotation_track" --outname="AT21new" --no_server
@@ -0,0 +1 @@
+fluentdna.py --fasta="/tmp/gnetum.fa" --ref_annotation="example_data/Gnetum_sample_genes.gff" --query_annotation="example_data/Gnetum_query_genes.gff" --contigs scaffold989535 scaffold776413 --outname="Anew" --no_server
@@ -0,0 +1 @@
+fluentdna.py --fasta="example_data/hg38_chr19_sample.fa" --outname="D4" --no_server -dt